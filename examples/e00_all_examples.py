@@ -13,37 +13,88 @@ Each tab contains all commands from the corresponding example:
 - subapps: Sub-applications with tab navigation (07)
 """
 
+from __future__ import annotations
+
+import functools
+import importlib
 import sys
 from pathlib import Path
 
+# Repository root, which contains the examples package
+_ROOT_DIR = str(Path(__file__).parent.parent)
+
 # Add parent directory to path for imports to work when running directly
-sys.path.insert(0, str(Path(__file__).parent.parent))
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
 
 import typer2ui
 from typer2ui import ui
 
-# Static imports of example modules
-from examples import e01_basic_typer_to_gui as ex01
-from examples import e02_arguments_and_output as ex02
-from examples import e03_ui_blocks as ex03
-from examples import e04_app_control as ex04
-from examples import e05_state as ex05
-from examples import e06_data_table as ex06
-from examples import e07_sub_applications as ex07
-
-# Create main app
-app = typer2ui.Typer2Ui(
+
+@functools.lru_cache(maxsize=None)
+def import_example(module_name: str):
+    """Import an example module from the examples package.
+
+    Results are memoized, so repeated lookups skip the import machinery.
+
+    Args:
+        module_name: Module name inside the examples package (e.g. "e01_basic_typer_to_gui")
+
+    Returns:
+        The imported module
+    """
+    return importlib.import_module(f"examples.{module_name}")
+
+
+# Example sub-apps: tab name -> (module name, app attribute, help text)
+_EXAMPLES = {
+    "basic": ("e01_basic_typer_to_gui", "typer_app", "01: Basic Typer to GUI"),
+    "params": ("e02_arguments_and_output", "app", "02: Parameters & Outputs"),
+    "ui": ("e03_ui_blocks", "app", "03: UI Components"),
+    "control": ("e04_app_control", "app", "04: App Control API"),
+    "state": ("e05_state", "app", "05: State Management"),
+    "datatable": ("e06_data_table", "app", "06: DataTable"),
+    "subapps": ("e07_sub_applications", "app", "07: Sub-Applications"),
+}
+
+# Short module aliases (ex01..ex07), resolved on first access by __getattr__
+_ALIASES = {
+    f"ex{module_name[1:3]}": module_name
+    for module_name, _, _ in _EXAMPLES.values()
+}
+
+
+def __getattr__(name: str):
+    """Lazily provide the gallery app and the ex01..ex07 modules (PEP 562).
+
+    The gallery app is published as ``app`` on first access, with every
+    example sub-app registered, so importers get the full gallery.
+    """
+    if name == "app":
+        add_examples()
+        globals()["app"] = _app
+        return _app
+    module_name = _ALIASES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_example(module_name)
+    globals()[name] = module
+    return module
+
+
+# Create main app; example sub-apps are registered lazily (see __getattr__)
+_app = typer2ui.Typer2Ui(
     title="Typer2UI Examples Gallery",
     description="Browse all examples in a single application",
 )
 
+# Tab names of the example sub-apps registered so far
+_added_examples: set[str] = set()
 
-# Add a welcome command at the main level (defined before adding sub-apps to be first)
-@app.command(view=True)
-def welcome():
-    """Welcome screen with overview of all examples."""
-    ui(
-        """
+
+# Static welcome content, built once and reused on every view
+_WELCOME_MD = typer2ui.Md(
+    """
 # Welcome to Typer2UI Examples Gallery
 
 This application demonstrates all features of the **typer2ui** library.
@@ -79,18 +130,51 @@ python examples/e00_all_examples.py --cli params basic-parameters Alice
 python examples/e00_all_examples.py --cli ui ui-table
 ```
 """
-    )
+)
+
+
+# Add a welcome command at the main level (defined before adding sub-apps to be first)
+@_app.command(view=True)
+def welcome():
+    """Welcome screen with overview of all examples."""
+    ui(_WELCOME_MD)
+
+
+def add_examples(names=None) -> None:
+    """Add example apps as sub-applications using add_typer().
+
+    Examples that are already registered are skipped.
+
+    Args:
+        names: Tab names to add (all examples if None)
+    """
+    for name, (module_name, attr, help_text) in _EXAMPLES.items():
+        if (names is None or name in names) and name not in _added_examples:
+            module = import_example(module_name)
+            _app.add_typer(getattr(module, attr), name=name, help=help_text)
+            _added_examples.add(name)
+
+
+def _requested_examples():
+    """Determine which examples the current invocation needs.
+
+    The GUI shows every tab, so all examples are needed. In CLI mode only the
+    sub-app named on the command line is imported. Everything else (--help,
+    main-level commands such as `welcome`) gets every tab, which keeps the
+    CLI a command group with the usual help output.
 
+    Returns:
+        Set of tab names, or None for all examples
+    """
+    if "--cli" not in sys.argv:
+        return None
 
-# Add each example as a sub-application using add_typer()
-app.add_typer(ex01.typer_app, name="basic", help="01: Basic Typer to GUI")
-app.add_typer(ex02.app, name="params", help="02: Parameters & Outputs")
-app.add_typer(ex03.app, name="ui", help="03: UI Components")
-app.add_typer(ex04.app, name="control", help="04: App Control API")
-app.add_typer(ex05.app, name="state", help="05: State Management")
-app.add_typer(ex06.app, name="datatable", help="06: DataTable")
-app.add_typer(ex07.app, name="subapps", help="07: Sub-Applications")
+    args = [arg for arg in sys.argv[1:] if arg != "--cli"]
+    if args and args[0] in _EXAMPLES:
+        return {args[0]}
+    return None
 
 
 if __name__ == "__main__":
-    app()
+    add_examples(_requested_examples())
+    _app()
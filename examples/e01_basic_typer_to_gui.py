@@ -8,8 +8,9 @@ This pattern is useful when:
 - You want to use the app as a sub-app in another Typer2Ui via add_subapp()
 """
 
+from __future__ import annotations
+
 import typer
-import typer2ui
 
 # Step 1: Create your Typer app as usual
 typer_app = typer.Typer()
@@ -53,6 +54,9 @@ def divide(a: float, b: float):
 
 @typer_app.command()
 def gui():
+    # Imported here so the plain CLI commands don't load the GUI wrapper
+    import typer2ui
+
     app = typer2ui.Typer2Ui(
         typer_app, title="My First GUI App", description="A simple calculator with GUI"
     )
@@ -66,12 +70,10 @@ if __name__ == "__main__":
     typer_app()
 
 
-"""
-Key Points:
------------
-1. The app works in BOTH GUI and CLI modes automatically
-2. Run without --cli for GUI: python e01_basic_typer_to_gui.py
-3. Run with --cli for CLI: python e01_basic_typer_to_gui.py --cli add 5 3
-4. Existing Typer apps can be wrapped with Typer2Ui(typer_app, ...) for GUI support
-5. This Typer2Ui can be added to another app via: main_app.add_subapp(app, name="calc")
-"""
+# Key Points:
+# -----------
+# 1. The app works in BOTH GUI and CLI modes automatically
+# 2. Run without --cli for GUI: python e01_basic_typer_to_gui.py
+# 3. Run with --cli for CLI: python e01_basic_typer_to_gui.py --cli add 5 3
+# 4. Existing Typer apps can be wrapped with Typer2Ui(typer_app, ...) for GUI support
+# 5. This Typer2Ui can be added to another app via: main_app.add_subapp(app, name="calc")
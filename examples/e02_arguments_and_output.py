@@ -9,8 +9,9 @@ This example demonstrates:
 - Auto-executing commands for welcome screens or dashboards.
 """
 
+from __future__ import annotations
+
 import asyncio
-import time
 from enum import Enum
 
 import typer2ui
@@ -31,22 +32,35 @@ class Priority(str, Enum):
     URGENT = "urgent"
 
 
-@app.command(view=True)
-def welcome_screen():
-    """
-    Demonstrates a command that runs automatically when selected in the GUI.
-    This is useful for dashboards or information-only screens.
+# Static Markdown blocks, built once at import and reused on every run
+_WELCOME_MD = typer2ui.Md(
     """
-    # Shortcut: ui(str) renders as Markdown
-    ui(
-        """
 # Welcome!
 
 This command runs **automatically** when selected because `view=True`.
 
 It's a great way to present initial information or a dashboard without requiring user interaction to click a "Run" button.
 """
-    )
+)
+
+_MARKDOWN_CONTENT_MD = typer2ui.Md(
+    """
+---
+### Markdown Content
+You can use **bold**, *italic*, and `code` formatting.
+- Item 1
+- Item 2
+"""
+)
+
+
+@app.command(view=True)
+def welcome_screen():
+    """
+    Demonstrates a command that runs automatically when selected in the GUI.
+    This is useful for dashboards or information-only screens.
+    """
+    ui(_WELCOME_MD)
 
 
 @app.command(button=True)
@@ -64,9 +78,11 @@ def basic_parameters(
     if excited:
         greeting += " How exciting!"
 
-    for i in range(times):
-        # Shortcut: ui(str) works for simple text too
-        ui(f"({i+1}/{times}) {greeting}")
+    # Render all repetitions in a single update instead of one per line
+    with ui.batch():
+        for i in range(times):
+            # Shortcut: ui(str) works for simple text too
+            ui(f"({i+1}/{times}) {greeting}")
 
     ui(f"Task priority set to: {priority.value}")
 
@@ -93,12 +109,14 @@ def create_task(
     In GUI mode, parameters and output are shown in a popup dialog.
     In CLI mode, works the same as any other command.
     """
+    priority_value = priority.value
+
     # Shortcut: ui(str) renders as Markdown
     ui("# Task Created Successfully")
     ui()
 
     ui(f"**Title:** {title}")
-    ui(f"**Priority:** {priority.value.upper()}")
+    ui(f"**Priority:** {priority_value.upper()}")
     ui(f"**Estimated Hours:** {estimated_hours}")
 
     # Simulate task creation
@@ -112,7 +130,7 @@ def create_task(
             cols=["Field", "Value"],
             data=[
                 ["Title", title],
-                ["Priority", priority.value],
+                ["Priority", priority_value],
                 ["Estimated Hours", str(estimated_hours)],
                 ["Task ID", str(task_id)],
             ],
@@ -120,7 +138,7 @@ def create_task(
         )
     )
 
-    return {"id": task_id, "title": title, "priority": priority.value}
+    return {"id": task_id, "title": title, "priority": priority_value}
 
 
 @app.command(view=True, modal=True)
@@ -133,49 +151,49 @@ def output_types():
     # Regular print() statements are captured and displayed
     print("This line comes from a standard print() statement.")
 
-    # Shortcut: ui(str) renders as Markdown
-    ui("This line uses the **ui(str)** shortcut.")
-
-    # Shortcut: ui() with no args creates empty line
-    ui()
+    # Render the remaining blocks together in a single update
+    with ui.batch():
+        # Shortcut: ui(str) renders as Markdown
+        ui("This line uses the **ui(str)** shortcut.")
+
+        # Shortcut: ui() with no args creates empty line
+        ui()
+
+        # Rich markdown content (a prebuilt typer2ui.Md component)
+        ui(_MARKDOWN_CONTENT_MD)
+
+        # Use Table component for structured data (no shortcut for this)
+        ui(
+            typer2ui.Table(
+                title="Output Methods Comparison",
+                cols=["Method", "Code", "Use Case"],
+                data=[
+                    ["Print", "print(...)", "Quick debugging, simple text"],
+                    ["UI Shortcut", "ui(str)", "Markdown-formatted content"],
+                    ["UI Empty", "ui()", "Add spacing/empty lines"],
+                    ["UI Object", "ui(42)", "Display any object as text"],
+                    ["Table", "ui(typer2ui.Table(...))", "Structured data"],
+                ],
+            )
+        )
 
-    # Rich markdown content
-    ui(
-        """
----
-### Markdown Content
-You can use **bold**, *italic*, and `code` formatting.
-- Item 1
-- Item 2
-"""
-    )
 
-    # Use Table component for structured data (no shortcut for this)
-    ui(
-        typer2ui.Table(
-            title="Output Methods Comparison",
-            cols=["Method", "Code", "Use Case"],
-            data=[
-                ["Print", "print(...)", "Quick debugging, simple text"],
-                ["UI Shortcut", "ui(str)", "Markdown-formatted content"],
-                ["UI Empty", "ui()", "Add spacing/empty lines"],
-                ["UI Object", "ui(42)", "Display any object as text"],
-                ["Table", "ui(typer2ui.Table(...))", "Structured data"],
-            ],
-        )
-    )
+# Column schema shared by every long_running_task run
+_STEP_COLS = ("Step", "Status")
 
 
 @app.command(threaded=True)
-def long_running_task(steps: int = 5):
+async def long_running_task(steps: int = 5):
     """Demonstrates a long-running task with real-time table updates."""
     # Shortcut: ui(str) renders as Markdown
     ui(f"## Processing {steps} steps...")
 
     # Use a context manager for progressive table updates
-    for i in range(5):
-        print(f"Processing step {i + 1}...")
-        time.sleep(0.8)
+    with ui(typer2ui.Table(cols=_STEP_COLS, data=[])) as table:
+        for i in range(steps):
+            print(f"Processing step {i + 1}...")
+            await asyncio.sleep(0.8)
+            table.add_row([f"Step {i + 1}", "[OK]"])
 
     ui("[OK] **All steps completed!**")
 
@@ -205,13 +223,11 @@ if __name__ == "__main__":
     app()
 
 
-"""
-CLI Examples:
--------------
-python examples/e02_arguments_and_output.py --cli welcome-screen
-python examples/e02_arguments_and_output.py --cli basic-parameters "Alice" --times 3 --excited --priority urgent
-python examples/e02_arguments_and_output.py --cli create-task "Implement feature X" --priority high --estimated-hours 8
-python examples/e02_arguments_and_output.py --cli output-types
-python examples/e02_arguments_and_output.py --cli long-running-task --steps 3
-python examples/e02_arguments_and_output.py --cli async-task --delay 1.5
-"""
+# CLI Examples:
+# -------------
+# python examples/e02_arguments_and_output.py --cli welcome-screen
+# python examples/e02_arguments_and_output.py --cli basic-parameters "Alice" --times 3 --excited --priority urgent
+# python examples/e02_arguments_and_output.py --cli create-task "Implement feature X" --priority high --estimated-hours 8
+# python examples/e02_arguments_and_output.py --cli output-types
+# python examples/e02_arguments_and_output.py --cli long-running-task --steps 3
+# python examples/e02_arguments_and_output.py --cli async-task --delay 1.5
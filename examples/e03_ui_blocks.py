@@ -9,7 +9,9 @@ This example demonstrates individual UI components:
 - Nested composition
 """
 
-import time
+from __future__ import annotations
+
+from functools import partial
 
 import typer2ui
 from typer2ui import ui
@@ -59,6 +61,8 @@ def ui_table():
 @app.command(threaded=True)
 def ui_table_progressive():
     """Table with progressive rendering - add rows dynamically with context manager."""
+    import time
+
     ui("## Progressive Table")
 
     # Use context manager for progressive rendering
@@ -108,9 +112,9 @@ def ui_button_link():
     ui(
         typer2ui.Row(
             [
-                typer2ui.Button("Save", on_click=lambda: print("Save clicked")),
-                typer2ui.Button("Cancel", on_click=lambda: print("Cancel clicked")),
-                typer2ui.Button("Delete", on_click=lambda: print("Delete clicked")),
+                typer2ui.Button("Save", on_click=partial(print, "Save clicked")),
+                typer2ui.Button("Cancel", on_click=partial(print, "Cancel clicked")),
+                typer2ui.Button("Delete", on_click=partial(print, "Delete clicked")),
             ]
         )
     )
@@ -119,9 +123,9 @@ def ui_button_link():
     ui(
         typer2ui.Column(
             [
-                typer2ui.Link("Settings", on_click=lambda: print("Settings clicked")),
-                typer2ui.Link("Help", on_click=lambda: print("Help clicked")),
-                typer2ui.Link("About", on_click=lambda: print("About clicked")),
+                typer2ui.Link("Settings", on_click=partial(print, "Settings clicked")),
+                typer2ui.Link("Help", on_click=partial(print, "Help clicked")),
+                typer2ui.Link("About", on_click=partial(print, "About clicked")),
             ]
         )
     )
@@ -366,32 +370,37 @@ This alert contains **formatted** content:
     )
 
 
+def _dashboard_buttons() -> typer2ui.Row:
+    """Build the dashboard buttons (interactive blocks are not shared by runs)."""
+    return typer2ui.Row(
+        [
+            typer2ui.Button("Refresh", on_click=partial(print, "Refreshing...")),
+            typer2ui.Button("Export", on_click=partial(print, "Exporting...")),
+        ]
+    )
+
+
+# Static dashboard metrics, built once at import and reused on every run
+_DASHBOARD_METRICS = typer2ui.Table(
+    cols=["Metric", "Value"],
+    data=[
+        ["Users", "1,234"],
+        ["Revenue", "$56,789"],
+        ["Growth", "+12%"],
+    ],
+    title="Key Metrics",
+)
+
+
 @app.command(view=True)
 def ui_nested():
     """Nested components - combining multiple components in a hierarchy."""
     ui("# Dashboard")
     ui("Example of nested component composition")
 
-    ui(
-        typer2ui.Row(
-            [
-                typer2ui.Button("Refresh", on_click=lambda: print("Refreshing...")),
-                typer2ui.Button("Export", on_click=lambda: print("Exporting...")),
-            ]
-        )
-    )
+    ui(_dashboard_buttons())
 
-    ui(
-        typer2ui.Table(
-            cols=["Metric", "Value"],
-            data=[
-                ["Users", "1,234"],
-                ["Revenue", "$56,789"],
-                ["Growth", "+12%"],
-            ],
-            title="Key Metrics",
-        )
-    )
+    ui(_DASHBOARD_METRICS)
 
     ui("All components work together seamlessly!")
 
@@ -400,15 +409,13 @@ if __name__ == "__main__":
     app()
 
 
-"""
-CLI Examples:
--------------
-python examples/e03_ui_blocks.py --cli ui-text-md
-python examples/e03_ui_blocks.py --cli ui-table
-python examples/e03_ui_blocks.py --cli ui-table-progressive
-python examples/e03_ui_blocks.py --cli ui-row-column
-python examples/e03_ui_blocks.py --cli ui-button-link
-python examples/e03_ui_blocks.py --cli ui-tabs
-python examples/e03_ui_blocks.py --cli ui-alert-confirm
-python examples/e03_ui_blocks.py --cli ui-nested
-"""
+# CLI Examples:
+# -------------
+# python examples/e03_ui_blocks.py --cli ui-text-md
+# python examples/e03_ui_blocks.py --cli ui-table
+# python examples/e03_ui_blocks.py --cli ui-table-progressive
+# python examples/e03_ui_blocks.py --cli ui-row-column
+# python examples/e03_ui_blocks.py --cli ui-button-link
+# python examples/e03_ui_blocks.py --cli ui-tabs
+# python examples/e03_ui_blocks.py --cli ui-alert-confirm
+# python examples/e03_ui_blocks.py --cli ui-nested
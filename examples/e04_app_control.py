@@ -9,7 +9,9 @@ This example demonstrates:
 - @app.init() - Decorator for initialization code (runs when GUI starts)
 """
 
-import time
+from __future__ import annotations
+
+from functools import partial
 
 import typer2ui
 from typer2ui import ui
@@ -70,21 +72,23 @@ def fetch_data(source: str = "database"):
     return {"records": 150, "source": source}
 
 
+# Static report table, built once at import and reused on every run
+_REPORT_TABLE = typer2ui.Table(
+    cols=["Metric", "Value"],
+    data=[
+        ["Total Records", "150"],
+        ["Processed", "120"],
+        ["Success Rate", "95%"],
+    ],
+    title="Summary",
+)
+
+
 @app.command(view=True)
 def generate_report():
     """Generate a final report."""
     ui("### Final Report")
-    ui(
-        typer2ui.Table(
-            cols=["Metric", "Value"],
-            data=[
-                ["Total Records", "150"],
-                ["Processed", "120"],
-                ["Success Rate", "95%"],
-            ],
-            title="Summary",
-        )
-    )
+    ui(_REPORT_TABLE)
     return {"status": "complete"}
 
 
@@ -93,58 +97,9 @@ def generate_report():
 # ============================================================================
 
 
-@app.command()
-def hold_demo():
-    """Demo of app.hold for GUI customization (GUI only)."""
-    ui("# GUI Customization with app.hold")
-
-    # Check if we're in GUI mode
-    if app.hold.page is None:
-        ui("**Note:** This demo only works in GUI mode")
-        ui("Run: `python examples/e04_app_control.py`")
-        return
-
-    ui("## 1. Access Flet Page")
-    ui("Customize the Flet page directly:")
-
-    ui(
-        typer2ui.Row(
-            [
-                typer2ui.Button(
-                    "Toggle Dark Mode",
-                    on_click=lambda: toggle_theme(),
-                    icon="dark_mode",
-                ),
-                typer2ui.Button(
-                    "Change Window Title", on_click=lambda: change_title(), icon="title"
-                ),
-            ]
-        )
-    )
-
-    ui("## 2. Access Command Output Controls")
-    ui("Modify output areas of other commands:")
-
-    ui(
-        typer2ui.Row(
-            [
-                typer2ui.Button(
-                    "Style Fetch Output",
-                    on_click=lambda: customize_fetch_output(),
-                    icon="palette",
-                ),
-                typer2ui.Button(
-                    "Clear Report Output",
-                    on_click=lambda: clear_report_output(),
-                    icon="clear",
-                ),
-            ]
-        )
-    )
-
-    ui("---")
-    ui(
-        """
+# Static Markdown blocks, built once at import and reused on every run
+_HOLD_CODE_EXAMPLES_MD = typer2ui.Md(
+    """
 ### Code Examples
 
 **Initialize with @app.init():**
@@ -186,8 +141,33 @@ if output:
     output.scroll = ft.ScrollMode.ALWAYS
     output.bgcolor = ft.colors.BLUE_50
 ```
-    """
-    )
+"""
+)
+
+
+@app.command()
+def hold_demo():
+    """Demo of app.hold for GUI customization (GUI only)."""
+    ui("# GUI Customization with app.hold")
+
+    # Check if we're in GUI mode
+    if app.hold.page is None:
+        ui("**Note:** This demo only works in GUI mode")
+        ui("Run: `python examples/e04_app_control.py`")
+        return
+
+    ui("## 1. Access Flet Page")
+    ui("Customize the Flet page directly:")
+
+    ui(_hold_page_buttons())
+
+    ui("## 2. Access Command Output Controls")
+    ui("Modify output areas of other commands:")
+
+    ui(_hold_output_buttons())
+
+    ui("---")
+    ui(_HOLD_CODE_EXAMPLES_MD)
 
 
 def toggle_theme():
@@ -206,6 +186,8 @@ def toggle_theme():
 
 def change_title():
     """Change the window title."""
+    import time
+
     page = app.hold.page
     if page:
         page.title = f"Custom Title - {time.strftime('%H:%M:%S')}"
@@ -243,40 +225,39 @@ def clear_report_output():
         ui("⚠ Run generate-report command first")
 
 
-@app.command(view=True)
-def control_demo():
-    """Interactive demo of run(), include(), and select()."""
-    ui("# Command Control Demo")
-    ui("Click buttons to see how each method works:")
-    ui("---")
+# hold_demo button rows are built per run: interactive blocks keep their own
+# Flet control and running state, so they must not be shared between views
+def _hold_page_buttons() -> typer2ui.Row:
+    """Build the hold_demo page customization buttons."""
+    return typer2ui.Row(
+        [
+            typer2ui.Button(
+                "Toggle Dark Mode", on_click=toggle_theme, icon="dark_mode"
+            ),
+            typer2ui.Button(
+                "Change Window Title", on_click=change_title, icon="title"
+            ),
+        ]
+    )
 
-    # Interactive buttons
-    ui(
-        typer2ui.Row(
-            [
-                typer2ui.Button(
-                    "Demo .run()",
-                    on_click=lambda: app.get_command("fetch-data").run(source="api"),
-                ),
-                typer2ui.Button(
-                    "Demo .include()",
-                    on_click=lambda: app.get_command("generate-report").include(),
-                ),
-                typer2ui.Button(
-                    "Demo .clear()",
-                    on_click=lambda: app.get_command().clear(),
-                ),
-                typer2ui.Button(
-                    "Demo .select()",
-                    on_click=lambda: app.get_command("fetch-data").select(),
-                ),
-            ]
-        )
+
+def _hold_output_buttons() -> typer2ui.Row:
+    """Build the hold_demo output customization buttons."""
+    return typer2ui.Row(
+        [
+            typer2ui.Button(
+                "Style Fetch Output", on_click=customize_fetch_output, icon="palette"
+            ),
+            typer2ui.Button(
+                "Clear Report Output", on_click=clear_report_output, icon="clear"
+            ),
+        ]
     )
 
-    ui("---")
-    ui(
-        """
+
+# Quick reference shown below the control demo buttons
+_CONTROL_REFERENCE_MD = typer2ui.Md(
+    """
 ### Quick Reference
 
 **`.run(**kwargs)`** - Execute and capture output separately
@@ -295,22 +276,62 @@ result = app.get_command("generate-report").include()
 ```python
 app.get_command("fetch-data").select()
 ```
-    """
+"""
+)
+
+
+# control_demo button actions by id
+_CONTROL_DEMO_ACTIONS = {
+    "run": lambda: app.get_command("fetch-data").run(source="api"),
+    "include": lambda: app.get_command("generate-report").include(),
+    "clear": lambda: app.get_command().clear(),
+    "select": lambda: app.get_command("fetch-data").select(),
+}
+
+
+def _control_demo_action(action: str) -> None:
+    """Run the control_demo button action with the given id."""
+    _CONTROL_DEMO_ACTIONS[action]()
+
+
+def _control_demo_buttons() -> typer2ui.Row:
+    """Build the control demo buttons, all dispatched through _control_demo_action."""
+    return typer2ui.Row(
+        [
+            typer2ui.Button(
+                f"Demo .{action}()", on_click=partial(_control_demo_action, action)
+            )
+            for action in _CONTROL_DEMO_ACTIONS
+        ]
     )
 
 
+@app.command(view=True)
+def control_demo():
+    """Interactive demo of run(), include(), and select()."""
+    # Show the whole demo page with a single update
+    with ui.batch():
+        ui("# Command Control Demo")
+        ui("Click buttons to see how each method works:")
+        ui("---")
+
+        # Interactive buttons
+        ui(_control_demo_buttons())
+
+        ui("---")
+        ui(_CONTROL_REFERENCE_MD)
+
+
 if __name__ == "__main__":
     app()
 
 
-"""
-CLI Examples:
--------------
-# Interactive demo (best viewed in GUI)
-python examples/e04_app_control.py
-
-# CLI mode
-python examples/e04_app_control.py --cli control-demo
-python examples/e04_app_control.py --cli fetch-data --source api
-python examples/e04_app_control.py --cli generate-report
-"""
+# CLI Examples:
+# -------------
+# # Interactive demo (best viewed in GUI)
+# python examples/e04_app_control.py
+#
+# # CLI mode
+# python examples/e04_app_control.py --cli control-demo
+# python examples/e04_app_control.py --cli fetch-data --source api
+# python examples/e04_app_control.py --cli generate-report
@@ -1,6 +1,9 @@
 """Example 5: State Management"""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
+from functools import partial
 
 import typer2ui
 from typer2ui import ui
@@ -11,7 +14,7 @@ app = typer2ui.Typer2Ui(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     id: int
     item: str
@@ -37,7 +40,7 @@ def state_demo():
                 typer2ui.Button(
                     "Decrement -", on_click=lambda: counter.set(counter.value - 1)
                 ),
-                typer2ui.Button("Reset", on_click=lambda: counter.set(0)),
+                typer2ui.Button("Reset", on_click=partial(counter.set, 0)),
             ]
         )
     )
@@ -68,7 +71,7 @@ def orders_demo():
             order.quantity,
             f"${order.total:.2f}",
             # This Link modifies the `selected_order_id` state on click
-            typer2ui.Link("Select", on_click=lambda o=order: selected_order_id.set(o)),
+            typer2ui.Link("Select", on_click=partial(selected_order_id.set, order)),
         ]
         for order in orders_data
     ]
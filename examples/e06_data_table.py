@@ -10,6 +10,10 @@ Run in CLI mode: python examples/e06_data_table.py --cli browse-users
 Run in GUI mode: python examples/e06_data_table.py
 """
 
+from __future__ import annotations
+
+from itertools import cycle
+
 import typer2ui
 from typer2ui import ui
 from typing import List, Tuple, Optional, Any
@@ -35,10 +39,31 @@ class UserDataSource(typer2ui.DataSource):
     - Pagination support
     """
 
-    def __init__(self):
-        """Initialize with mock user data."""
-        # Generate 100 mock users
-        self.users = self._generate_mock_users(100)
+    # Sortable columns by name
+    _COLUMNS = {"Name": 0, "Email": 1, "Role": 2, "Status": 3}
+
+    def __init__(self, count: int = 100):
+        """Initialize with mock user data.
+
+        Args:
+            count: Number of mock users to generate
+        """
+        self._set_users(self._generate_mock_users(count))
+
+    def _set_users(self, users: List[List[Any]]) -> None:
+        """Replace the user rows and rebuild the search index.
+
+        Args:
+            users: User rows [name, email, role, status]
+        """
+        self.users = users
+        # Lowercased text of each row, so filtering is one substring test per
+        # row (cells are joined with a unit separator to avoid cross-cell hits)
+        self._search_blobs = [
+            "\x1f".join(str(cell) for cell in row).lower() for row in users
+        ]
+        # Sorted copies of the unfiltered rows, by (column index, ascending)
+        self._sorted_users: dict[tuple[int, bool], List[List[Any]]] = {}
 
     def _generate_mock_users(self, count: int) -> List[List[Any]]:
         """Generate mock user data.
@@ -86,17 +111,27 @@ class UserDataSource(typer2ui.DataSource):
         roles = ["Admin", "User", "Manager", "Developer", "Designer"]
         statuses = ["Active", "Inactive", "Pending"]
 
-        users = []
-        for i in range(count):
-            first_name = first_names[i % len(first_names)]
-            last_name = last_names[i % len(last_names)]
-            name = f"{first_name} {last_name} {i + 1}"
-            email = f"{first_name.lower()}.{last_name.lower()}{i + 1}@example.com"
-            role = roles[i % len(roles)]
-            status = statuses[i % len(statuses)]
-            users.append([name, email, role, status])
-
-        return users
+        # Names paired with their lowercase form, lowered once for the emails
+        firsts = [(name, name.lower()) for name in first_names]
+        lasts = [(name, name.lower()) for name in last_names]
+
+        # Each list is cycled independently; range() bounds the row count
+        rows = zip(
+            range(1, count + 1),
+            cycle(firsts),
+            cycle(lasts),
+            cycle(roles),
+            cycle(statuses),
+        )
+        return [
+            [
+                f"{first} {last} {n}",
+                f"{first_lower}.{last_lower}{n}@example.com",
+                role,
+                status,
+            ]
+            for n, (first, first_lower), (last, last_lower), role, status in rows
+        ]
 
     def fetch(
         self,
@@ -118,29 +153,40 @@ class UserDataSource(typer2ui.DataSource):
         Returns:
             Tuple of (rows, total_count)
         """
-        # Start with all data
-        data = list(self.users)
-
         # Apply filter
         if filter_text:
             filter_lower = filter_text.lower()
             data = [
                 row
-                for row in data
-                if any(filter_lower in str(cell).lower() for cell in row)
+                for row, blob in zip(self.users, self._search_blobs)
+                if filter_lower in blob
             ]
+        else:
+            data = self.users
 
         # Apply sorting
         if sort_by:
-            column_index = {
-                "Name": 0,
-                "Email": 1,
-                "Role": 2,
-                "Status": 3,
-            }.get(sort_by)
+            column_index = self._COLUMNS.get(sort_by)
 
             if column_index is not None:
-                data.sort(key=lambda x: str(x[column_index]), reverse=not ascending)
+                if filter_text:
+                    data = sorted(
+                        data,
+                        key=lambda x: str(x[column_index]),
+                        reverse=not ascending,
+                    )
+                else:
+                    # Orderings of the unfiltered rows are reused across page turns
+                    cache_key = (column_index, ascending)
+                    ordered = self._sorted_users.get(cache_key)
+                    if ordered is None:
+                        ordered = sorted(
+                            data,
+                            key=lambda x: str(x[column_index]),
+                            reverse=not ascending,
+                        )
+                        self._sorted_users[cache_key] = ordered
+                    data = ordered
 
         # Get total count (after filtering, before pagination)
         total = len(data)
@@ -196,7 +242,7 @@ def large_dataset():
     # Create custom data source with more records
     class LargeUserDataSource(UserDataSource):
         def __init__(self):
-            self.users = self._generate_mock_users(500)
+            super().__init__(count=500)
 
     table = typer2ui.DataTable(
         cols=["Name", "Email", "Role", "Status"],
@@ -220,20 +266,10 @@ def admin_only():
     class AdminDataSource(UserDataSource):
         """Data source that only shows admin users."""
 
-        def fetch(
-            self,
-            offset: int,
-            limit: int,
-            sort_by: Optional[str] = None,
-            ascending: bool = True,
-            filter_text: Optional[str] = None,
-        ) -> Tuple[List[List[Any]], int]:
-            # Pre-filter to admins only
-            admin_users = [row for row in self.users if row[2] == "Admin"]
-            self.users = admin_users
-
-            # Apply normal fetch logic
-            return super().fetch(offset, limit, sort_by, ascending, filter_text)
+        def __init__(self):
+            super().__init__()
+            # Pre-filter to admins only, once
+            self._set_users([row for row in self.users if row[2] == "Admin"])
 
     table = typer2ui.DataTable(
         cols=["Name", "Email", "Role", "Status"],
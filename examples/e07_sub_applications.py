@@ -8,6 +8,8 @@ This example demonstrates:
 - Tab-aware command execution
 """
 
+from __future__ import annotations
+
 import typer2ui
 from typer2ui import ui
 
@@ -58,29 +60,35 @@ def create(name: str, email: str = ""):
 # ============================================================================
 
 
+# Sample users: (name, email, status)
+_USERS_DATA = (
+    ("Alice Johnson", "alice@example.com", "Active"),
+    ("Bob Smith", "bob@example.com", "Active"),
+    ("Charlie Brown", "charlie@example.com", "Inactive"),
+)
+
+
 @users_app.command()
 def list_users(status: str = "all"):
     """List all users."""
-    ui("# User List")
-    ui(f"Showing users with status: **{status}**")
-    ui()
-
-    users_data = [
-        ["Alice Johnson", "alice@example.com", "Active"],
-        ["Bob Smith", "bob@example.com", "Active"],
-        ["Charlie Brown", "charlie@example.com", "Inactive"],
-    ]
+    users_data = list(_USERS_DATA)
 
     if status != "all":
-        users_data = [u for u in users_data if u[2].lower() == status.lower()]
+        wanted = status.lower()
+        users_data = [u for u in users_data if u[2].lower() == wanted]
 
-    ui(
-        typer2ui.Table(
-            cols=["Name", "Email", "Status"],
-            data=users_data,
-            title=f"Users ({len(users_data)} total)",
+    # Write the whole listing to the terminal at once
+    with ui.buffered():
+        ui("# User List")
+        ui(f"Showing users with status: **{status}**")
+        ui()
+        ui(
+            typer2ui.Table(
+                cols=["Name", "Email", "Status"],
+                data=users_data,
+                title=f"Users ({len(users_data)} total)",
+            )
         )
-    )
 
 
 @users_app.command()
@@ -98,8 +106,8 @@ def update(user_id: int, name: str = "", email: str = ""):
 
     if changes:
         ui("**Changes:**")
-        for change in changes:
-            ui(change)
+        # One Markdown list for all changes
+        ui("\n".join(changes))
         ui()
         ui("✅ User updated successfully!")
     else:
@@ -152,6 +160,15 @@ def create_order(product: str, quantity: int = 1):
     ui("✅ Order created successfully!")
 
 
+# Sample orders: (order id, product, quantity, status)
+_ORDERS_DATA = (
+    ("1001", "Laptop", "3", "Shipped"),
+    ("1002", "Mouse", "10", "Processing"),
+    ("1003", "Keyboard", "5", "Delivered"),
+    ("1004", "Monitor", "2", "Processing"),
+)
+
+
 @orders_app.command()
 def list_orders(status: str = "all"):
     """List all orders."""
@@ -159,15 +176,11 @@ def list_orders(status: str = "all"):
     ui(f"Showing orders with status: **{status}**")
     ui()
 
-    orders_data = [
-        ["1001", "Laptop", "3", "Shipped"],
-        ["1002", "Mouse", "10", "Processing"],
-        ["1003", "Keyboard", "5", "Delivered"],
-        ["1004", "Monitor", "2", "Processing"],
-    ]
+    orders_data = list(_ORDERS_DATA)
 
     if status != "all":
-        orders_data = [o for o in orders_data if o[3].lower() == status.lower()]
+        wanted = status.lower()
+        orders_data = [o for o in orders_data if o[3].lower() == wanted]
 
     ui(
         typer2ui.Table(
@@ -217,40 +230,41 @@ def sales_report():
     ui("**Average Order Value:** $87.23")
 
 
+def _user_stats_row() -> typer2ui.Row:
+    """Build the user statistics layout (containers are not shared by views)."""
+    return typer2ui.Row(
+        [
+            typer2ui.Column([typer2ui.Text("Total Users"), typer2ui.Md("## 1,234")]),
+            typer2ui.Column([typer2ui.Text("Active Users"), typer2ui.Md("## 987")]),
+            typer2ui.Column(
+                [typer2ui.Text("New This Month"), typer2ui.Md("## 156")]
+            ),
+        ]
+    )
+
+
+# Static user statistics table, built once at import and reused on every view
+_USER_STATS_TABLE = typer2ui.Table(
+    cols=["Status", "Count", "Percentage"],
+    data=[
+        ["Active", "987", "80%"],
+        ["Inactive", "247", "20%"],
+    ],
+    title="User Status Breakdown",
+)
+
+
 @reports_app.command(view=True)
 def user_stats():
     """View user statistics dashboard."""
     ui("# User Statistics")
     ui()
 
-    ui(
-        typer2ui.Row(
-            [
-                typer2ui.Column(
-                    [typer2ui.Text("Total Users"), typer2ui.Text("1,234", size=32, weight="bold")]
-                ),
-                typer2ui.Column(
-                    [typer2ui.Text("Active Users"), typer2ui.Text("987", size=32, weight="bold")]
-                ),
-                typer2ui.Column(
-                    [typer2ui.Text("New This Month"), typer2ui.Text("156", size=32, weight="bold")]
-                ),
-            ]
-        )
-    )
+    ui(_user_stats_row())
 
     ui()
 
-    ui(
-        typer2ui.Table(
-            cols=["Status", "Count", "Percentage"],
-            data=[
-                ["Active", "987", "80%"],
-                ["Inactive", "247", "20%"],
-            ],
-            title="User Status Breakdown",
-        )
-    )
+    ui(_USER_STATS_TABLE)
 
 
 @reports_app.command()
@@ -295,43 +309,46 @@ if __name__ == "__main__":
     app()
 
 
-"""
-Usage Examples:
----------------
-
-GUI Mode (default):
-    python examples/e07_sub_applications.py
-
-    - You'll see tabs for: main | users | orders | reports
-    - Click tabs to switch between sub-applications
-    - Each tab has its own set of commands
-    - Commands are scoped to the current tab
-
-CLI Mode:
-    # Main app command
-    python examples/e07_sub_applications.py --cli create --name "Alice" --email "alice@example.com"
-
-    # User commands
-    python examples/e07_sub_applications.py --cli users list-users
-    python examples/e07_sub_applications.py --cli users delete --user-id 5 --confirm
-
-    # Order commands
-    python examples/e07_sub_applications.py --cli orders create-order --product "Laptop" --quantity 2
-    python examples/e07_sub_applications.py --cli orders list-orders --status processing
-
-    # Report commands
-    python examples/e07_sub_applications.py --cli reports sales-report
-    python examples/e07_sub_applications.py --cli reports generate-report --report-type detailed
-
-Programmatic Command Control:
-    from typer2ui import ui
-    import typer2ui
-
-    # In your code, you can programmatically control commands:
-
-    # Execute command with qualified name
-    app.get_command("users:list-users").run(status="active")
-
-    # Switch tabs and commands
-    app.get_command("orders:list-orders").select()  # Switches to orders tab and selects command
-"""
+# Usage Examples:
+# ---------------
+#
+# GUI Mode (default):
+#     python examples/e07_sub_applications.py
+#
+#     - You'll see tabs for: main | users | orders | reports
+#     - Click tabs to switch between sub-applications
+#     - Each tab has its own set of commands
+#     - Commands are scoped to the current tab
+#
+# CLI Mode:
+#     # Main app command
+#     python examples/e07_sub_applications.py --cli create --name "Alice" --email "alice@example.com"
+#
+#     # User commands
+#     python examples/e07_sub_applications.py --cli users list-users
+#     python examples/e07_sub_applications.py --cli users delete --user-id 5 --confirm
+#
+#     # Order commands
+#     python examples/e07_sub_applications.py --cli orders create-order --product "Laptop" --quantity 2
+#     python examples/e07_sub_applications.py --cli orders list-orders --status processing
+#
+#     # Report commands
+#     python examples/e07_sub_applications.py --cli reports sales-report
+#     python examples/e07_sub_applications.py --cli reports generate-report --report-type detailed
+#
+# Programmatic Command Control:
+#     from typer2ui import ui
+#     import typer2ui
+#
+#     # In your code, you can programmatically control commands:
+#
+#     # Execute command with qualified name
+#     app.get_command("users:list-users").run(status="active")
+#
+#     # Switch tabs and commands
+#     app.get_command("orders:list-orders").select()  # Switches to orders tab and selects command
+#
+#     # Keep the command handle to run it repeatedly without looking it up again
+#     list_users_cmd = app.get_command("users:list-users")
+#     for status in ("active", "inactive"):
+#         list_users_cmd.run(status=status)
@@ -19,8 +19,7 @@ class Priority(str, Enum):
     HIGH = "high"
 
 
-@tapp.command()
-@upp.def_command(button=True, modal=True)
+@upp.command(button=True, modal=True)
 def create_user(name: str, email: str, role: str = "User"):
     """Create a new user (shown in modal dialog)."""
     ui("# User Created")
@@ -41,8 +40,7 @@ def create_user(name: str, email: str, role: str = "User"):
     return {"name": name, "email": email, "role": role}
 
 
-@tapp.command()
-@upp.def_command(button=True, modal=True)
+@upp.command(button=True, modal=True)
 def delete_item(item_id: int, confirm: bool = False):
     """Delete an item (with confirmation in modal)."""
     if not confirm:
@@ -59,8 +57,7 @@ def delete_item(item_id: int, confirm: bool = False):
     return {"deleted": item_id}
 
 
-@tapp.command()
-@upp.def_command(button=True, modal=True, submit_name="Create Task")
+@upp.command(button=True, modal=True, submit_name="Create Task")
 def create_task(
     title: str,
     priority: Priority = Priority.MEDIUM,
@@ -81,8 +78,7 @@ def create_task(
     return {"id": task_id, "title": title, "priority": priority.value}
 
 
-@tapp.command()
-@upp.def_command(view=True)
+@upp.command(view=True)
 def dashboard():
     """Main dashboard (not modal)."""
     ui("# Dashboard")
@@ -12,8 +12,7 @@ upp = tu.UiApp(
 )
 
 
-@tapp.command()
-@upp.def_command(button=True, modal=True, view=True)
+@upp.command(button=True, modal=True, view=True)
 def auto_modal():
     """Modal with auto-execution (view=True).
 
@@ -30,8 +29,7 @@ def auto_modal():
         ui(f"Line {i+1}")
 
 
-@tapp.command()
-@upp.def_command(button=True, modal=True, long=True)
+@upp.command(button=True, modal=True)
 def long_modal():
     """Modal with long-running task.
 
@@ -49,8 +47,7 @@ def long_modal():
     ui("**All steps completed!**")
 
 
-@tapp.command()
-@upp.def_command(button=True, modal=True, header=False)
+@upp.command(button=True, modal=True, header=False)
 def no_header_modal(name: str = "World"):
     """Modal with no header.
 
@@ -60,8 +57,7 @@ def no_header_modal(name: str = "World"):
     ui(f"Hello, {name}!")
 
 
-@tapp.command()
-@upp.def_command(button=True, modal=True, auto_scroll=False)
+@upp.command(button=True, modal=True, auto_scroll=False)
 def no_scroll_modal():
     """Modal with no auto-scroll.
 
@@ -74,8 +70,7 @@ def no_scroll_modal():
         ui(f"Line {i+1}")
 
 
-@tapp.command()
-@upp.def_command(button=True, modal=True, submit_name="Create Item")
+@upp.command(button=True, modal=True, submit_name="Create Item")
 def custom_submit(item_name: str):
     """Modal with custom submit button name."""
     ui("# Item Created")
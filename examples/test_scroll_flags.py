@@ -11,8 +11,7 @@ upp = tu.UiApp(
 )
 
 
-@tapp.command()
-@upp.def_command(button=True)
+@upp.command(button=True)
 def with_auto_scroll():
     """Command with auto_scroll=True (default)."""
     ui("# With Auto Scroll (Default)")
@@ -21,8 +20,7 @@ def with_auto_scroll():
         ui(f"Line {i + 1}")
 
 
-@tapp.command()
-@upp.def_command(button=True, auto_scroll=False)
+@upp.command(button=True, auto_scroll=False)
 def without_auto_scroll():
     """Command with auto_scroll=False."""
     ui("# Without Auto Scroll")
@@ -31,8 +29,7 @@ def without_auto_scroll():
         ui(f"Line {i + 1}")
 
 
-@tapp.command()
-@upp.def_command(view=True)
+@upp.command(view=True)
 def dashboard_view():
     """Command with view=True (auto + no header + no auto_scroll)."""
     ui("# Dashboard View")
@@ -52,8 +49,7 @@ def dashboard_view():
         ui(f"Detail line {i + 1}")
 
 
-@tapp.command()
-@upp.def_command(auto=True, header=False, auto_scroll=False)
+@upp.command(auto=True, header=False, auto_scroll=False)
 def equivalent_to_view():
     """Equivalent to view=True using individual flags."""
     ui("# Equivalent to View")
@@ -0,0 +1,24 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture
+def use_ui_ctx(monkeypatch):
+    """Make a runner context the current UIRunnerCtx for one test.
+
+    The previously current context is restored after the test, including
+    when the code under test (e.g. a CLIRunner) replaced it.
+
+    Returns:
+        Function taking the context to make current
+    """
+    from typer2ui.context import UIRunnerCtx
+
+    monkeypatch.setattr(UIRunnerCtx, "_current_instance", UIRunnerCtx._current_instance)
+
+    def use(ctx):
+        UIRunnerCtx._current_instance = ctx
+        return ctx
+
+    return use
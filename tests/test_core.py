@@ -1,7 +1,9 @@
 """Unit tests for core reflection logic."""
 
+from concurrent.futures import Future
 from enum import Enum
 
+import pytest
 import typer
 
 from typer2ui.spec_builder import build_app_spec
@@ -176,3 +178,313 @@ def test_build_gui_model_required_vs_optional():
 
     assert param_dict["required_param"].required is True
     assert param_dict["optional_param"].required is False
+
+
+def test_build_gui_model_with_postponed_annotations():
+    """Test that string annotations (PEP 563) are resolved to real types."""
+    app = typer.Typer()
+
+    @app.command()
+    def paint(name: "str", coats: "int" = 1, color: "TestColor" = TestColor.RED):
+        """Paint something."""
+        pass
+
+    gui_model = build_app_spec(app)
+
+    param_dict = {p.name: p for p in gui_model.commands[0].params}
+    assert param_dict["name"].param_type == ParamType.STRING
+    assert param_dict["coats"].param_type == ParamType.INTEGER
+    assert param_dict["color"].param_type == ParamType.ENUM
+    assert param_dict["color"].enum_choices == ("red", "green", "blue")
+
+
+def test_build_gui_model_with_async_ui_command():
+    """Test that async Typer2Ui commands keep their GUI options and params."""
+    from typer2ui import Typer2Ui
+
+    upp = Typer2Ui()
+
+    @upp.command(view=True)
+    async def fetch(count: int = 3):
+        """Fetch items."""
+        pass
+
+    gui_model = build_app_spec(upp.typer)
+
+    cmd = gui_model.commands[0]
+    assert cmd.callback._original_async_func is fetch
+    assert cmd.ui_spec.auto is True
+    assert cmd.ui_spec.header is False
+    assert cmd.params[0].param_type == ParamType.INTEGER
+
+
+def test_command_view_clear_output_drops_component_refs():
+    """Test that clearing a command's output releases its tracked controls."""
+    import flet as ft
+
+    from typer2ui.runners.gui_runner import _CommandView
+
+    view = _CommandView()
+    view.output_view = ft.ListView(controls=[ft.Text("old")])
+    view.component_refs[1] = view.output_view.controls[0]
+
+    view.clear_output()
+
+    assert view.output_view.controls == []
+    assert view.component_refs == {}
+
+
+@pytest.mark.usefixtures("use_ui_ctx")
+def test_cli_execute_command_streams_ui_output_in_call_order(capfd):
+    """Test that CLI ui() output is shown as it is made, interleaved with print()."""
+    from typer2ui import Typer2Ui, ui
+    from typer2ui.runners.cli_runner import CLIRunner
+
+    upp = Typer2Ui()
+
+    @upp.command()
+    def report():
+        """Report progress."""
+        ui("Started")
+        print("working")
+        return "Done"
+
+    runner = CLIRunner(build_app_spec(upp.typer), upp)
+    result, error, output = runner.execute_command("report", {})
+
+    assert error is None
+    assert result == "Done"
+    assert [line.strip() for line in output.splitlines()] == [
+        "Started",
+        "working",
+        "Done",
+    ]
+
+
+@pytest.mark.usefixtures("use_ui_ctx")
+def test_gui_sync_command_refreshes_page_once():
+    """Test that a buffered GUI command shows all its output with one page update."""
+    import asyncio
+
+    import flet as ft
+
+    from typer2ui import Typer2Ui, ui
+    from typer2ui.runners.gui_context import GUIRunnerCtx
+    from typer2ui.runners.gui_runner import GUIRunner, _CommandView
+
+    upp = Typer2Ui()
+
+    @upp.command(threaded=False)
+    def report():
+        """Report."""
+        ui("# Title")
+        ui("Body")
+        ui("Footer")
+
+    class _Page:
+        updates = 0
+
+        def run_task(self, task):
+            _Page.updates += 1
+            return Future()
+
+    runner = GUIRunner(build_app_spec(upp.typer), upp)
+    runner.page = _Page()
+    runner.ctx = GUIRunnerCtx(runner.page)
+    runner.current_command = runner.app_spec.commands[0]
+    view = _CommandView()
+    view.output_view = ft.ListView()
+    runner.command_views[(None, "report")] = view
+
+    asyncio.run(runner.execute_command("report", {}))
+
+    assert len(view.output_view.controls) == 3
+    assert _Page.updates == 1
+
+
+def test_cli_pass_through_writer_splits_lines():
+    """Test that the CLI print() writer emits complete lines across writes."""
+    from typer2ui.runners.cli_runner import _PassThroughWriter
+
+    lines = []
+    writer = _PassThroughWriter(lines.append)
+
+    writer.write("a\nb")
+    writer.write("c\n\nd\n")
+    writer.write("tail")
+    writer.flush()
+
+    assert lines == ["a", "bc", "", "d", "tail"]
+
+
+def test_get_command_finds_root_and_sub_app_commands():
+    """Test command lookup by plain and qualified (sub-app) names."""
+    from typer2ui import Typer2Ui
+
+    upp = Typer2Ui()
+    users = Typer2Ui()
+
+    @upp.command()
+    def status():
+        """Show status."""
+
+    @users.command()
+    def create(name: str):
+        """Create a user."""
+
+    upp.add_typer(users, name="users")
+    upp.app_spec = build_app_spec(upp.typer)
+
+    assert upp.get_command("status").command_spec.name == "status"
+    assert upp.get_command("users:create").command_spec.name == "create"
+    assert upp.get_command("create") is None
+    assert upp.get_command("users:missing") is None
+
+
+def test_get_command_sees_commands_of_a_rebuilt_app_spec():
+    """Test that the command index follows app_spec and handles a missing spec."""
+    from typer2ui import Typer2Ui
+
+    upp = Typer2Ui()
+    assert upp._get_command_index() == {}
+
+    @upp.command()
+    def status():
+        """Show status."""
+
+    upp.app_spec = build_app_spec(upp.typer)
+    assert upp.get_command("status") is not None
+    assert upp.get_command("deploy") is None
+
+    @upp.command()
+    def deploy():
+        """Deploy."""
+
+    upp.app_spec = build_app_spec(upp.typer)
+    assert upp.get_command("deploy").command_spec.name == "deploy"
+
+
+def test_gui_page_updates_are_coalesced_until_run():
+    """Test that page update requests made before the update runs are merged."""
+    import asyncio
+
+    from typer2ui.runners.gui_runner import GUIRunner
+    from typer2ui.specs import AppSpec
+
+    class _Page:
+        def __init__(self):
+            self.tasks = []
+            self.updates = 0
+
+        def run_task(self, task):
+            self.tasks.append(task)
+            return Future()
+
+        def update(self):
+            self.updates += 1
+
+    runner = GUIRunner(AppSpec(commands=()))
+    runner.page = _Page()
+
+    for _ in range(3):
+        runner._safe_page_update()
+    assert len(runner.page.tasks) == 1
+
+    asyncio.run(runner.page.tasks[0]())
+    runner._safe_page_update()
+
+    assert runner.page.updates == 1
+    assert len(runner.page.tasks) == 2
+
+
+def test_gui_cancelled_page_update_does_not_block_later_updates():
+    """Test that a cancelled scheduled update lets the next request schedule again."""
+    from typer2ui.runners.gui_runner import GUIRunner
+    from typer2ui.specs import AppSpec
+
+    class _Page:
+        def __init__(self):
+            self.futures = []
+
+        def run_task(self, task):
+            self.futures.append(Future())
+            return self.futures[-1]
+
+    runner = GUIRunner(AppSpec(commands=()))
+    runner.page = _Page()
+
+    runner._safe_page_update()
+    runner.page.futures[0].cancel()
+    runner._safe_page_update()
+
+    assert len(runner.page.futures) == 2
+
+
+@pytest.mark.usefixtures("use_ui_ctx")
+def test_include_streams_into_the_running_command():
+    """Test that include() output appears inline, in call order, as it is made."""
+    from typer2ui import Typer2Ui, ui
+    from typer2ui.runners.cli_runner import CLIRunner
+
+    upp = Typer2Ui()
+
+    @upp.command()
+    def step():
+        """Run a step."""
+        ui("Step output")
+        return "Step result"
+
+    @upp.command()
+    def workflow():
+        """Run the workflow."""
+        ui("Before")
+        step = upp.get_command("step")
+        step._output = "stale"
+        assert step.include().result == "Step result"
+        assert step.out == ""
+        ui("After")
+
+    upp.app_spec = build_app_spec(upp.typer)
+    upp.runner = CLIRunner(upp.app_spec, upp)
+    _, error, output = upp.runner.execute_command("workflow", {})
+
+    assert error is None
+    assert [line.strip() for line in output.splitlines()] == [
+        "Before",
+        "Step output",
+        "Step result",
+        "After",
+    ]
+
+
+@pytest.mark.usefixtures("use_ui_ctx")
+@pytest.mark.parametrize("print2ui", [False, True])
+def test_cli_buffered_output_is_captured_and_written_once(capfd, print2ui):
+    """Test that ui.buffered() output in execute_command is recorded and written on exit."""
+    from typer2ui import Typer2Ui, ui
+    from typer2ui.runners.cli_runner import CLIRunner
+
+    upp = Typer2Ui(print2ui=print2ui)
+
+    @upp.command()
+    def listing():
+        """List things."""
+        with ui.buffered():
+            ui("line one")
+            ui("line two")
+            assert capfd.readouterr().out == ""
+        assert [line.strip() for line in capfd.readouterr().out.splitlines()] == [
+            "line one",
+            "line two",
+        ]
+        ui("after")
+
+    runner = CLIRunner(build_app_spec(upp.typer), upp)
+    _, error, output = runner.execute_command("listing", {})
+
+    assert error is None
+    assert [line.strip() for line in output.splitlines()] == [
+        "line one",
+        "line two",
+        "after",
+    ]
@@ -0,0 +1,395 @@
+"""Unit tests for UI block components."""
+
+from typer2ui.ui_blocks import Row, Table, Text
+
+
+def test_table_add_row_appends_data():
+    """Test that add_row appends a row to the table data."""
+    table = Table(cols=["Name", "Role"])
+
+    table.add_row(["Alice", "Admin"])
+
+    assert table.data == [["Alice", "Admin"]]
+
+
+def test_table_add_rows_appends_all_rows():
+    """Test that add_rows appends rows in order, including Row components."""
+    table = Table(cols=["Name", "Role"], data=[["Alice", "Admin"]])
+
+    table.add_rows([["Bob", "User"], Row([Text("Carol"), Text("Manager")])])
+
+    assert len(table.data) == 3
+    assert table.data[1] == ["Bob", "User"]
+    assert [cell.content for cell in table.data[2]] == ["Carol", "Manager"]
+
+
+def test_table_add_rows_updates_display_once(monkeypatch):
+    """Test that add_rows triggers a single display update for the batch."""
+    table = Table(cols=["Step"])
+    calls = []
+    monkeypatch.setattr(table, "_update", lambda: calls.append(True))
+
+    table.add_rows([["one"], ["two"], ["three"]])
+
+    assert len(calls) == 1
+
+
+def test_ui_batch_emits_single_column(use_ui_ctx):
+    """Test that ui.batch() collects ui() calls into one Column."""
+    from typer2ui import ui
+    from typer2ui.runners.cli_context import CLIRunnerCtx
+    from typer2ui.ui_blocks import Column, Md
+
+    ctx = CLIRunnerCtx()
+    use_ui_ctx(ctx)
+    with ctx.new_ui_stack() as outer_stack:
+        with ui.batch():
+            ui("# Title")
+            ui()
+            ui(Text("Body"))
+
+    assert len(outer_stack) == 1
+    column = outer_stack[0]
+    assert isinstance(column, Column)
+    assert isinstance(column.children[0], Md)
+    assert column.children[1].content == ""
+    assert column.children[2].content == "Body"
+
+
+def test_md_build_cli_reuses_parsed_markdown():
+    """Test that Md shares parsed Rich markdown between equal contents."""
+    from typer2ui.ui_blocks import Md
+
+    md = Md("# Title")
+
+    first = md.build_cli(None)
+    assert md.build_cli(None) is first
+    assert Md("# Title").build_cli(None) is first
+
+    md.content = "# Changed"
+    assert md.build_cli(None) is not first
+    assert md.build_cli(None).markup == "# Changed"
+
+
+def test_leaf_blocks_use_slots():
+    """Test that simple leaf blocks are slotted (no per-instance __dict__)."""
+    from typer2ui.ui_blocks import Md, Print, Tab, Tabs
+
+    blocks = [Text("a"), Md("b"), Print("c"), Tab("x", "y"), Tabs([Tab("x", "y")])]
+
+    for block in blocks:
+        assert not hasattr(block, "__dict__")
+
+
+class _StubGuiCtx:
+    """Minimal GUI context that builds callables and records each build."""
+
+    runner = None
+
+    def __init__(self):
+        self.built = []
+
+    def build_child(self, parent, child):
+        import flet as ft
+
+        self.built.append(child)
+        return ft.Text(str(child() if callable(child) else child))
+
+
+def test_tabs_build_gui_builds_tabs_on_first_selection(monkeypatch):
+    """Test that Tabs builds only the selected tab, then others on demand."""
+    from types import SimpleNamespace
+
+    import flet as ft
+
+    from typer2ui.ui_blocks import Tab, Tabs
+
+    monkeypatch.setattr(ft.Container, "update", lambda self: None)
+    ctx = _StubGuiCtx()
+    first, second = (lambda: "one"), (lambda: "two")
+    control = Tabs([Tab("One", first), Tab("Two", second)]).build_gui(ctx)
+
+    assert ctx.built == [first]
+
+    event = SimpleNamespace(control=SimpleNamespace(selected_index=1))
+    control.on_change(event)
+    control.on_change(event)
+
+    assert ctx.built == [first, second]
+
+
+def test_tabs_build_gui_without_tabs():
+    """Test that Tabs whose tabs were all removed builds an empty tab bar."""
+    from typer2ui.ui_blocks import Tab, Tabs
+
+    tabs = Tabs([Tab("One", "one")])
+    tabs.tabs.clear()  # Tabs([]) is rejected; emptied later is still possible
+    control = tabs.build_gui(_StubGuiCtx())
+
+    tab_bar, tab_view = control.content.controls
+    assert tab_bar.tabs == []
+    assert tab_view.controls == []
+
+
+def test_table_streams_new_rows_in_cli():
+    """Test that rows added after a CLI render are printed without the header."""
+    import io
+
+    from rich.console import Console
+
+    from typer2ui.runners.cli_context import CLIRunnerCtx
+
+    ctx = CLIRunnerCtx()
+    ctx.console = Console(file=io.StringIO(), width=80)
+    table = Table(cols=["Step", "Status"])
+
+    ctx.console.print(ctx.build_child(Text(""), table))
+    header_output = ctx.console.file.getvalue()
+    table.add_row(["Load", "[OK]"])
+    row_output = ctx.console.file.getvalue()[len(header_output):]
+
+    assert "Step" in header_output
+    assert "Load" in row_output
+    assert "Step" not in row_output
+    assert table.data == [["Load", "[OK]"]]
+
+
+def test_table_with_rows_streams_later_rows_aligned_in_cli():
+    """Test that rows streamed into a table that starts with rows line up and close."""
+    import io
+
+    from rich.console import Console
+
+    from typer2ui.runners.cli_context import CLIRunnerCtx
+
+    ctx = CLIRunnerCtx()
+    ctx.console = Console(file=io.StringIO(), width=80)
+    table = Table(cols=["Name", "Role"], data=[["Alice", "Admin"]])
+
+    with table:
+        ctx.console.print(ctx.build_child(Text(""), table))
+        table_output = ctx.console.file.getvalue()
+        table.add_row(["Bob", "User"])
+        table.add_row(["Christopher", "Manager"])
+    lines = ctx.console.file.getvalue()[len(table_output):].splitlines()
+
+    table_lines = table_output.splitlines()
+    assert table_lines[0].startswith("┏")
+    assert not table_lines[-1].startswith("└")
+    first_row = next(line for line in table_lines if "Alice" in line)
+    assert [line.index("│", 1) for line in lines[:-1]] == [first_row.index("│", 1)] * 2
+    assert "Christopher" in lines[1] and "…" not in "".join(lines)
+    assert lines[-1].startswith("└") and len(lines[-1]) == len(first_row)
+
+
+def test_static_table_with_wide_cell_keeps_other_columns_in_cli():
+    """Test that a static table is auto-sized and a too-wide cell is cut, not others."""
+    import io
+
+    from rich.console import Console
+
+    from typer2ui.runners.cli_context import CLIRunnerCtx
+
+    ctx = CLIRunnerCtx()
+    ctx.console = Console(file=io.StringIO(), width=60)
+    table = Table(cols=["Name", "Description"], data=[["a", "x" * 150], ["bob", "short"]])
+
+    ctx.console.print(ctx.build_child(Text(""), table))
+    output = ctx.console.file.getvalue()
+
+    assert "Name" in output and "bob" in output and "…" in output
+    assert all(len(line) <= 60 for line in output.splitlines())
+
+
+def test_fingerprint_matches_for_equal_static_blocks():
+    """Test that equal static trees share a fingerprint and callables opt out."""
+    from typer2ui.ui_blocks import Button, Column, fingerprint_of
+
+    def build(value):
+        return Column([Text("Title"), Table(cols=["A"], data=[[value]])])
+
+    assert fingerprint_of(build(1)) == fingerprint_of(build(1))
+    assert fingerprint_of(build(1)) != fingerprint_of(build(2))
+    assert fingerprint_of(Row([Button("Go", on_click=lambda: None)])) is None
+
+
+def test_dynamic_block_skips_unchanged_gui_rerender():
+    """Test that ui.dx() keeps its controls when the rendered output is unchanged."""
+    from typer2ui import State
+    from typer2ui.output import DynamicBlock
+    from typer2ui.runners.cli_context import CLIRunnerCtx
+
+    class _Ctx(CLIRunnerCtx):
+        page = None
+        builds = 0
+
+        def build_child(self, parent, child):
+            _Ctx.builds += 1
+            return super().build_child(parent, child)
+
+    state = State("a")
+    block = DynamicBlock(lambda: f"Length: {len(state.value)}", (state,))
+    block.build_gui(_Ctx())
+    assert _Ctx.builds == 1
+
+    state.set("b")  # Same rendered output
+    assert _Ctx.builds == 1
+
+    state.set("abc")
+    assert _Ctx.builds == 2
+
+
+def test_large_table_builds_gui_rows_in_windows():
+    """Test that a large GUI table only builds controls for the visible window."""
+    table = Table(cols=["N"], data=[[i] for i in range(250)])
+    ctx = _StubGuiCtx()
+    table._ctx = ctx
+
+    column = table.build_gui(ctx)
+    more_button = column.controls[-1]
+
+    assert len(table._flet_control.rows) == 100
+    assert more_button.visible
+
+    more_button.on_click()  # Flet calls zero-argument handlers without the event
+    table._show_more_rows()
+    table.add_row([250])
+
+    assert len(table._flet_control.rows) == 251
+    assert not more_button.visible
+
+
+def test_table_interns_column_headers():
+    """Test that equal column headers built at runtime share one string object."""
+    first = Table(cols=["".join(["Na", "me"])])
+    second = Table(cols=["".join(["Nam", "e"])])
+
+    assert first.cols[0] is second.cols[0]
+
+
+def test_ui_buffered_writes_cli_output_once(use_ui_ctx):
+    """Test that ui.buffered() holds CLI output until the block exits."""
+    import io
+
+    from rich.console import Console
+
+    from typer2ui import ui
+    from typer2ui.runners.cli_context import CLIRunnerCtx
+
+    ctx = CLIRunnerCtx()
+    ctx.console = Console(file=io.StringIO(), width=80)
+    use_ui_ctx(ctx)
+    with ui.buffered():
+        ui(Text("first"))
+        ui(Text("second"))
+        assert ctx.console.file.getvalue() == ""
+
+    assert ctx.console.file.getvalue() == "first\nsecond\n"
+
+
+def test_table_update_cell_rebuilds_only_that_gui_cell():
+    """Test that update_cell refreshes one GUI cell and keeps the others."""
+    table = Table(cols=["Step", "Status"], data=[["Load", "..."], ["Save", "..."]])
+    ctx = _StubGuiCtx()
+    table._ctx = ctx
+    data_table = table.build_gui(ctx)
+    untouched = data_table.rows[1].cells[1].content
+
+    table.update_cell(0, 1, "[OK]")
+
+    assert data_table.rows[0].cells[1].content.value == "[OK]"
+    assert data_table.rows[1].cells[1].content is untouched
+
+
+def test_link_click_shows_callback_output_with_one_refresh(use_ui_ctx):
+    """Test that a Link runs its callback and shows its ui() output at once."""
+    from typer2ui import ui
+    from typer2ui.runners.cli_context import CLIRunnerCtx
+    from typer2ui.ui_blocks import Link
+
+    class _Runner:
+        def __init__(self):
+            self.added = []
+            self.refreshes = 0
+
+        def add_to_output(self, control, component=None, update=True):
+            self.added.append((control, update))
+
+        def _safe_page_update(self):
+            self.refreshes += 1
+
+    class _Ctx(CLIRunnerCtx):
+        runner = _Runner()
+
+    ctx = _Ctx()
+    use_ui_ctx(ctx)
+    control = Link("Go", on_click=lambda: (ui("one"), ui("two"))).build_gui(ctx)
+    list(control.on_click(None))  # Flet drives the generator handler
+
+    assert [update for _, update in ctx.runner.added] == [False, False]
+    assert ctx.runner.refreshes == 1
+
+
+def test_ui_without_value_renders_empty_line():
+    """Test that ui() (None) renders an empty line, not the text "None"."""
+    from typer2ui.runners.cli_context import CLIRunnerCtx
+
+    renderable = CLIRunnerCtx().build_child(Text(""), None)
+
+    assert renderable.plain == ""
+
+
+def test_link_ignores_clicks_while_its_action_runs(monkeypatch):
+    """Test that Flet's dispatch shows a Link disabled and runs its action once."""
+    import asyncio
+    from types import SimpleNamespace
+
+    import flet as ft
+
+    from typer2ui.runners.cli_context import CLIRunnerCtx
+    from typer2ui.ui_blocks import Link
+
+    class _Runner:
+        def _safe_page_update(self):
+            pass
+
+    class _Ctx(CLIRunnerCtx):
+        runner = _Runner()
+
+    sent = []  # Disabled state at each update Flet sends for the event
+
+    class _Session:
+        index: dict = {}
+
+        async def after_event(self, control):
+            sent.append(link.disabled)
+            if len(sent) == 1:
+                # A second click dispatched while the first is in flight
+                await link._trigger_event("click", None)
+
+    page = SimpleNamespace(session=_Session())
+    monkeypatch.setattr(ft.TextButton, "page", property(lambda self: page))
+    calls = []
+    link = Link("Go", on_click=lambda: calls.append(link.disabled)).build_gui(_Ctx())
+
+    asyncio.run(link._trigger_event("click", None))
+
+    assert calls == [True]
+    assert sent == [True, True, False]
+    assert link.disabled is False
+
+
+def test_link_click_without_runner_still_runs_callback(use_ui_ctx):
+    """Test that a click with no GUI runner runs the callback and skips output."""
+    from typer2ui import ui
+    from typer2ui.runners.cli_context import CLIRunnerCtx
+    from typer2ui.ui_blocks import Link
+
+    ctx = CLIRunnerCtx()
+    calls = []
+    use_ui_ctx(ctx)
+    link = Link("Go", on_click=lambda: (calls.append(1), ui("one")))
+    control = link.build_gui(ctx)
+    list(control.on_click(None))  # Flet drives the generator handler
+
+    assert calls == [1]
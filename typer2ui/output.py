@@ -5,12 +5,24 @@ This module provides the primary API for displaying UI components:
 - ui.print() - Plain text output
 - ui.dx() - Dynamic/reactive content
 - ui.md() - Explicit markdown output
+- ui.batch() - Group several ui() calls into a single render
 """
 
+from contextlib import contextmanager
 from typing import Any, Callable, Optional
 from dataclasses import dataclass
 
-from .ui_blocks import UiBlock, Text, Md, Column, get_current_runner, set_current_runner
+from .context import UIRunnerCtx
+from .ui_blocks import (
+    UiBlock,
+    Text,
+    Md,
+    Column,
+    get_current_runner,
+    set_current_runner,
+    to_component,
+    fingerprints_of,
+)
 
 
 class DynamicBlock(UiBlock):
@@ -31,6 +43,8 @@ class DynamicBlock(UiBlock):
         self.renderer = renderer
         self.dependencies = dependencies
         self._container = None
+        # Fingerprint of the last GUI render, to skip unchanged re-renders
+        self._fingerprint = None
 
     def __repr__(self):
         deps = ', '.join(str(d) for d in self.dependencies)
@@ -94,15 +108,21 @@ class DynamicBlock(UiBlock):
 
         def render():
             """Re-render on state change."""
-            # Clear container
-            self._container.controls.clear()
-
             # Execute renderer with new UI stack context
             with ctx.new_ui_stack() as ui_stack:
                 result = self.renderer()
                 if result is not None:
                     ui_stack.append(result)
 
+            # Keep the existing controls if the output is unchanged
+            fingerprint = fingerprints_of(ui_stack)
+            if fingerprint is not None and fingerprint == self._fingerprint:
+                return
+            self._fingerprint = fingerprint
+
+            # Clear container
+            self._container.controls.clear()
+
             # Build controls from stack
             controls = [ctx.build_child(self, item) for item in ui_stack]
 
@@ -133,6 +153,8 @@ class UiOutput:
         ui.print(value)     # Display plain text
         ui.dx(fn, *deps)    # Create dynamic/reactive block
         ui.md(value)        # Explicit markdown
+        with ui.batch():    # Render several ui() calls at once
+            ...
     """
 
     def __call__(self, component_or_value: Any = None) -> Any:
@@ -155,8 +177,6 @@ class UiOutput:
         Raises:
             RuntimeError: If called outside command execution context
         """
-        from .context import UIRunnerCtx
-
         ctx = UIRunnerCtx.instance()
         if ctx is None:
             raise RuntimeError("ui() can only be called during command execution.")
@@ -211,6 +231,67 @@ class UiOutput:
         component = Md(str(value))
         return self(component)
 
+    @contextmanager
+    def batch(self):
+        """Collect ui() calls and present them as a single Column.
+
+        Each ui() call normally builds and displays its component right away,
+        which in GUI mode means one page update per call. Inside a batch the
+        components are captured and displayed together when the block exits.
+
+        Usage:
+            with ui.batch():
+                ui("# Report")
+                ui()
+                ui(typer2ui.Table(cols=["Name"], data=[["Alice"]]))
+
+        Yields:
+            The UI stack capturing the batched components
+
+        Raises:
+            RuntimeError: If used outside command execution context
+        """
+        ctx = UIRunnerCtx.instance()
+        if ctx is None:
+            raise RuntimeError("ui.batch() can only be used during command execution.")
+
+        with ctx.new_ui_stack() as ui_stack:
+            yield ui_stack
+
+        if ui_stack:
+            # Callables are kept as-is so build_child() can capture their output
+            children = [
+                item if callable(item) else to_component(item) for item in ui_stack
+            ]
+            self(Column(children))
+
+    @contextmanager
+    def buffered(self):
+        """Buffer CLI output and write it to the terminal in one go.
+
+        In the CLI each ui() call is written (and flushed) as soon as it is
+        rendered. Inside this block the rendered output is held by the CLI
+        context and written with a single write when the block exits, which
+        is noticeably cheaper when stdout is piped. The output is still
+        recorded in the command's captured output, in order. Output still
+        appears incrementally in the GUI.
+
+        Note that plain print() output is not buffered and may appear before
+        buffered ui() output.
+
+        Usage:
+            with ui.buffered():
+                for name in names:
+                    ui(f"- {name}")
+        """
+        buffered_output = getattr(UIRunnerCtx.instance(), "buffered_output", None)
+        if buffered_output is None:
+            yield
+            return
+
+        with buffered_output():
+            yield
+
 
 ui = UiOutput()
 
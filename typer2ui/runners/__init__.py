@@ -2,6 +2,14 @@
 
 from .base import Runner
 from .cli_runner import CLIRunner
-from .gui_runner import GUIRunner
 
 __all__ = ["Runner", "CLIRunner", "GUIRunner"]
+
+
+def __getattr__(name: str):
+    """Import GUIRunner (and Flet) only when it is first accessed (PEP 562)."""
+    if name == "GUIRunner":
+        from .gui_runner import GUIRunner
+
+        return GUIRunner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,14 +5,16 @@ This module implements the UIRunnerCtx for CLI rendering using Rich,
 providing the build_child() method that handles all content type complexity.
 """
 
-from typing import Any, Optional
-from rich.console import Console, Group, RenderableType
-from rich.markdown import Markdown
-from rich.text import Text as RichText
+import sys
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, TYPE_CHECKING
 
 from ..context import UIRunnerCtx, UIBlockType
 from ..ui_blocks import UiBlock
 
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+
 
 class CLIRunnerCtx(UIRunnerCtx):
     """CLI-specific runner context using Rich.
@@ -23,8 +25,46 @@ class CLIRunnerCtx(UIRunnerCtx):
 
     def __init__(self):
         """Initialize CLI context with Rich console."""
+        # Rich is only imported once a CLI context is actually created
+        from rich.console import Console
+
         super().__init__()
         self.console = Console()
+        # Rendered ui() output held by buffered_output() (None = not buffering)
+        self._output_buffer: Optional[list[str]] = None
+
+    @contextmanager
+    def buffered_output(self) -> Iterator[None]:
+        """Hold rendered ui() output and write it to the terminal on exit.
+
+        Output rendered by CLIRunner.execute_command is passed through
+        write_output() and collected here; output printed directly to the
+        console (commands run by Typer) is held by the Rich console buffer.
+        Nested blocks are written by the outermost one.
+        """
+        if self._output_buffer is not None:
+            yield
+            return
+
+        self._output_buffer = []
+        try:
+            with self.console:
+                yield
+        finally:
+            lines, self._output_buffer = self._output_buffer, None
+            if lines:
+                print("\n".join(lines), file=sys.__stdout__, flush=True)
+
+    def write_output(self, text: str) -> None:
+        """Write rendered ui() output to the terminal, or hold it while buffering.
+
+        Args:
+            text: Rendered output, without a trailing newline
+        """
+        if self._output_buffer is not None:
+            self._output_buffer.append(text)
+        else:
+            print(text, file=sys.__stdout__, flush=True)
 
     def _handle_immediate_output(self, component: UIBlockType) -> None:
         """Handle output when there's no active stack context.
@@ -42,7 +82,7 @@ class CLIRunnerCtx(UIRunnerCtx):
         renderable = self.build_child(root, component)
         self.console.print(renderable)
 
-    def build_child(self, parent: UiBlock, child: UIBlockType) -> RenderableType:
+    def build_child(self, parent: UiBlock, child: UIBlockType) -> "RenderableType":
         """Build child component - handles all types.
 
         This is where all the complexity lives. Handles:
@@ -59,9 +99,10 @@ class CLIRunnerCtx(UIRunnerCtx):
         Returns:
             Rich renderable ready to print
         """
-        # Case 1: String → Markdown
+        # Case 1: String → Markdown (via Md, which caches parsed markdown)
         if isinstance(child, str):
-            return Markdown(child)
+            from ..ui_blocks import Md
+            return Md(child).build_cli(self)
 
         # Case 2: UIBlock → Build and set parent relationship
         if isinstance(child, UiBlock):
@@ -101,6 +142,8 @@ class CLIRunnerCtx(UIRunnerCtx):
             renderables = [self.build_child(parent, item) for item in ui_stack]
 
             # Return single or grouped
+            from rich.console import Group
+
             if len(renderables) == 0:
                 return ""
             elif len(renderables) == 1:
@@ -108,5 +151,7 @@ class CLIRunnerCtx(UIRunnerCtx):
             else:
                 return Group(*renderables)
 
-        # Fallback: Convert to string
-        return RichText(str(child))
+        # Fallback: Convert to string (None → empty line)
+        from rich.text import Text as RichText
+
+        return RichText("" if child is None else str(child))
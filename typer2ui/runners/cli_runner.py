@@ -1,6 +1,5 @@
 """CLI runner for command-line execution."""
 
-import asyncio
 import inspect
 import sys
 from io import StringIO
@@ -41,10 +40,12 @@ class _PassThroughWriter(StringIO):
         # Also display immediately (line by line)
         self._buffer += text
 
-        # Process complete lines
-        while '\n' in self._buffer:
-            line, self._buffer = self._buffer.split('\n', 1)
-            self.display_callback(line)
+        # Process complete lines (split once; re-splitting the remainder
+        # for every line is quadratic in the size of a large write)
+        if '\n' in self._buffer:
+            *lines, self._buffer = self._buffer.split('\n')
+            for line in lines:
+                self.display_callback(line)
 
         return result
 
@@ -160,12 +161,32 @@ class CLIRunner(Runner):
         stdout_writer = _PassThroughWriter(display_print_line)
         stderr_capture = StringIO()
 
+        def display_ui_item(item: Any):
+            """Build a ui() item and print it right away, like the GUI does."""
+            # Capture the rendered output (Rich capture also works while the
+            # console is holding output for ui.buffered())
+            text_capture = StringIO()
+            with redirect_stdout(text_capture), self.ctx.console.capture() as capture:
+                # Build renderable from item
+                renderable = self.ctx.build_child(root, item)
+                # Print using Rich console
+                self.ctx.console.print(renderable)
+
+            captured = (text_capture.getvalue() + capture.get()).rstrip('\n')
+            if captured:
+                output_lines.append(captured)
+                # Also print to stdout (held until the block exits in ui.buffered())
+                self.ctx.write_output(captured)
+
         result = None
         exception = None
 
         try:
-            # Execute command with UI stack context
+            # Execute command with UI stack context; each ui() call is
+            # rendered as soon as it is made instead of after the command
             with self.ctx.new_ui_stack() as ui_stack:
+                ui_stack.register_observer(display_ui_item)
+
                 # Conditionally redirect stdout based on print2ui flag
                 if self.ui and self.ui.print2ui:
                     # Capture print() statements
@@ -185,22 +206,6 @@ class CLIRunner(Runner):
                 if result is not None:
                     ui_stack.append(result)
 
-            # Process UI stack - build and print each item
-            for item in ui_stack:
-                # Capture the rendered output
-                text_capture = StringIO()
-                with redirect_stdout(text_capture):
-                    # Build renderable from item
-                    renderable = self.ctx.build_child(root, item)
-                    # Print using Rich console
-                    self.ctx.console.print(renderable)
-
-                captured = text_capture.getvalue()
-                if captured:
-                    output_lines.append(captured.rstrip('\n'))
-                    # Also print to stdout
-                    print(captured.rstrip('\n'), file=sys.__stdout__)
-
         except Exception as e:
             exception = e
 
@@ -179,9 +179,9 @@ class GUIRunnerCtx(UIRunnerCtx):
             lv._flet_control = lv_control
             return lv_control
 
-        # Fallback: Convert to string and create Text
+        # Fallback: Convert to string and create Text (None → empty line)
         from ..ui_blocks import Text
-        text = Text(str(child))
+        text = Text("" if child is None else str(child))
         text._ctx = self
         control = text.build_gui(self)
         text._flet_control = control
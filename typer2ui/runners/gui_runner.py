@@ -41,9 +41,11 @@ class _RealTimeWriter(io.StringIO):
     def write(self, text):
         if text:
             self.buffer += text
-            while '\n' in self.buffer:
-                line, self.buffer = self.buffer.split('\n', 1)
-                self.append_callback(line)
+            if '\n' in self.buffer:
+                # Split once; re-splitting the remainder per line is quadratic
+                *lines, self.buffer = self.buffer.split('\n')
+                for line in lines:
+                    self.append_callback(line)
         return len(text)
 
     def flush(self):
@@ -65,6 +67,17 @@ class _CommandView:
         self.current_text_control: Optional[ft.Text] = None  # For live text updates (long commands)
         self.run_button: Optional[ft.ElevatedButton] = None  # Reference to run button
 
+    def clear_output(self) -> None:
+        """Remove all output controls and drop the references kept to them.
+
+        Without dropping component_refs, controls of cleared runs (e.g. a
+        finished progressive table with all its rows) would stay alive for
+        the lifetime of the app.
+        """
+        if self.output_view:
+            self.output_view.controls.clear()
+        self.component_refs.clear()
+
 
 class GUIRunner(Runner):
     """Runner for Flet-based GUI applications."""
@@ -113,6 +126,9 @@ class GUIRunner(Runner):
         # Supports nested reactive contexts (though rare)
         self._reactive_contexts: list[ReactiveContext] = []
 
+        # Whether a scheduled page update has not run yet (see _safe_page_update)
+        self._page_update_pending = False
+
     def start(self) -> None:
         """Start the Flet GUI application."""
         # Flet app will be started via ft.app() externally
@@ -150,12 +166,16 @@ class GUIRunner(Runner):
 
         return None
 
-    def add_to_output(self, control: ft.Control, component: Any = None) -> None:
+    def add_to_output(
+        self, control: ft.Control, component: Any = None, update: bool = True
+    ) -> None:
         """Add Flet control to output view.
 
         Args:
             control: Flet control to add
             component: Optional UiBlock component reference for tracking
+            update: Whether to refresh the page right away. Pass False when
+                adding several controls and refresh once afterwards.
         """
         view = self._get_current_view()
         if view and view.output_view:
@@ -172,7 +192,7 @@ class GUIRunner(Runner):
                 # If component is reactive, track it globally
                 if hasattr(component, '_reactive_id'):
                     self._reactive_components[component._reactive_id] = control
-            if self.page:
+            if update and self.page:
                 # Thread-safe update for Flet 0.80+
                 self._safe_page_update()
 
@@ -195,20 +215,39 @@ class GUIRunner(Runner):
 
         In Flet 0.80+, page.update() must be called from the main thread.
         This method uses page.run_task() to ensure thread-safe updates.
+
+        Requests are coalesced: while a scheduled update has not run yet,
+        further calls are no-ops, since that update will also send their
+        changes. A burst of ui() calls therefore costs one page update.
         """
         if not self.page:
             return
 
+        if self._page_update_pending:
+            return
+        self._page_update_pending = True
+
         # Use page.run_task for thread-safe async execution
         async def do_update():
+            # Clear first, so changes made during update() schedule a new one
+            self._page_update_pending = False
             self.page.update()
 
+        def on_done(future) -> None:
+            # A cancelled update never ran do_update(); clear the flag so
+            # later refreshes are not dropped
+            if future.cancelled():
+                self._page_update_pending = False
+
         try:
-            self.page.run_task(do_update)
+            future = self.page.run_task(do_update)
         except Exception:
             # Fallback to direct update if run_task fails
             # (e.g., if already in main thread)
+            self._page_update_pending = False
             self.page.update()
+            return
+        future.add_done_callback(on_done)
 
     @property
     def current_reactive_context(self) -> Optional[ReactiveContext]:
@@ -852,7 +891,7 @@ class GUIRunner(Runner):
         # Long-running tasks keep their output for review
         if not command.ui_spec.threaded and selected_view.output_view:
             if selected_view.output_view.controls:
-                selected_view.output_view.controls.clear()
+                selected_view.clear_output()
 
         if self.page:
             self.page.update()
@@ -1106,7 +1145,7 @@ class GUIRunner(Runner):
                 async def handle_clear(e):
                     # Clear output only (no reexecution)
                     if view.output_view:
-                        view.output_view.controls.clear()
+                        view.clear_output()
                         # Clear current text control for long commands
                         view.current_text_control = None
                         if self.page:
@@ -1368,7 +1407,7 @@ class GUIRunner(Runner):
 
             # Clear output for this command
             if view.output_view:
-                view.output_view.controls.clear()
+                view.clear_output()
                 if self.page:
                     self.page.update()
 
@@ -1594,16 +1633,19 @@ class GUIRunner(Runner):
                 if result is not None:
                     ui_stack.append(result)
 
-            # Process UI stack - build and add each item to output
+            # Process UI stack - build and add each item to output,
+            # then refresh the page once for the whole stack
             for item in ui_stack:
                 # Build control from item
                 control = self.ctx.build_child(root, item)
-                self.add_to_output(control)
+                self.add_to_output(control, update=False)
 
                 # Capture text representation for output (from original item)
                 text_repr = self._component_to_text(item)
                 if text_repr:
                     output_lines.append(text_repr)
+            if ui_stack and self.page:
+                self._safe_page_update()
 
             stderr_text = stderr_capture.getvalue()
 
@@ -1666,9 +1708,8 @@ class GUIRunner(Runner):
                 def on_append(item):
                     """Build and display item immediately."""
                     control = self.ctx.build_child(root, item)
+                    # add_to_output refreshes the page
                     self.add_to_output(control)
-                    if self.page:
-                        self.page.update()
 
                     # Also capture for text output
                     text_repr = self._component_to_text(item)
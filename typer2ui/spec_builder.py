@@ -2,7 +2,7 @@
 
 import inspect
 from enum import Enum as PyEnum
-from typing import Any, Callable, Optional, get_args, get_origin
+from typing import Any, Callable, Optional, get_args, get_origin, get_type_hints
 
 import typer
 from typer.models import CommandInfo, ParameterInfo
@@ -64,6 +64,24 @@ def _get_param_type(annotation: Any) -> tuple[ParamType, Optional[type], Optiona
     return ParamType.UNSUPPORTED, annotation, None
 
 
+def _resolve_type_hints(callback: Callable) -> dict[str, Any]:
+    """Resolve a callback's type hints, evaluating postponed annotations.
+
+    Modules using `from __future__ import annotations` store annotations as
+    strings; they are evaluated here the same way Typer does.
+
+    Args:
+        callback: Command callback function
+
+    Returns:
+        Mapping of parameter name to resolved annotation (empty if unresolvable)
+    """
+    try:
+        return get_type_hints(callback, include_extras=True)
+    except Exception:
+        return {}
+
+
 def _extract_param_info(param_name: str, param: inspect.Parameter) -> ParamSpec:
     """Extract parameter information from an inspect.Parameter."""
     from typer.models import ArgumentInfo, OptionInfo
@@ -135,7 +153,10 @@ def _extract_command_info(command_name: str, command_info: CommandInfo) -> Comma
     params: list[ParamSpec] = []
     if callback:
         sig = inspect.signature(callback)
+        type_hints = _resolve_type_hints(callback)
         for param_name, param in sig.parameters.items():
+            if param_name in type_hints:
+                param = param.replace(annotation=type_hints[param_name])
             param_spec = _extract_param_info(param_name, param)
             params.append(param_spec)
 
@@ -1,13 +1,12 @@
 """Typer2Ui and UICommand - Main UI classes for typer-ui."""
 
 from typing import Any, Callable, Optional, TYPE_CHECKING, Union
+import functools
 import sys
 import typer
-import flet as ft
 
 from .spec_builder import build_app_spec, _GUI_OPTIONS_ATTR
 from .specs import CommandUiSpec, AppSpec, CommandSpec
-from .runners.gui_runner import create_flet_app
 from .runners.cli_runner import CLIRunner
 from .ui_blocks import get_current_runner
 
@@ -15,6 +14,75 @@ if TYPE_CHECKING:
     pass
 
 
+def _prepare_command(
+    func: Callable,
+    *,
+    button: bool,
+    threaded: bool,
+    auto: bool,
+    header: bool,
+    submit_name: str,
+    on_select: Optional[Callable],
+    auto_scroll: bool,
+    view: bool,
+    modal: bool,
+) -> Callable:
+    """Attach GUI options to a command function and adapt it for Typer.
+
+    Shared by Typer2Ui.command() and Typer2Ui.def_command().
+
+    Args:
+        func: Command function (sync or async)
+        Other arguments: GUI options, as documented on Typer2Ui.command()
+
+    Returns:
+        The function to register with Typer - func itself, or a sync
+        wrapper running it with asyncio.run() if func is async
+    """
+    import inspect
+
+    # Handle view flag - overrides auto, header, and auto_scroll
+    if view:
+        auto = True
+        header = False
+        auto_scroll = False
+
+    # Store GUI options on the function
+    ui_spec = CommandUiSpec(
+        button=button,
+        threaded=threaded,
+        auto=auto,
+        header=header,
+        submit_name=submit_name,
+        on_select=on_select,
+        auto_scroll=auto_scroll,
+        modal=modal,
+    )
+    setattr(func, _GUI_OPTIONS_ATTR, ui_spec)
+
+    if not inspect.iscoroutinefunction(func):
+        return func
+
+    # Async functions are wrapped for Typer compatibility; wraps() also sets
+    # __wrapped__, which lets typing.get_type_hints() resolve postponed
+    # annotations against the original function's module globals
+    @functools.wraps(func)
+    def sync_wrapper(*args, **kwargs):
+        import asyncio
+
+        return asyncio.run(func(*args, **kwargs))
+
+    # Copy over the GUI options to the wrapper
+    setattr(sync_wrapper, _GUI_OPTIONS_ATTR, ui_spec)
+
+    # Store reference to original async function
+    setattr(sync_wrapper, '_original_async_func', func)
+
+    sync_wrapper.__signature__ = inspect.signature(func)  # type: ignore[attr-defined]
+
+    return sync_wrapper
+
+
 class UICommand:
     """Wrapper for command operations.
 
@@ -209,11 +277,20 @@ class UICommand:
             >>> # Execute inline and get result
             >>> result = app.command("process").include().result
         """
-        # Execute via runner if available (ensures proper stack context)
-        if self.ui_app.runner:
-            # Use runner's execution mechanism with stack context
-            from .context import _current_stack_var
+        from .context import _current_stack_var
 
+        outer_stack = _current_stack_var.get()
+        if outer_stack is not None:
+            # Inside a running command or click handler: ui() calls go straight
+            # to the enclosing stack, so its observers show them as they are
+            # made instead of after the included command returns
+            result = self.command_spec.callback(**kwargs)
+            self.result = result
+            self._output = ""  # Output belongs to the enclosing command
+            if result is not None:
+                outer_stack.append(result)
+        # Execute via runner if available (ensures proper stack context)
+        elif self.ui_app.runner:
             # Get the runner's context
             if hasattr(self.ui_app.runner, 'ctx'):
                 ctx = self.ui_app.runner.ctx
@@ -331,6 +408,11 @@ class Typer2Ui:
         self.runner: Optional[Any] = None
         self.current_command: Optional[CommandSpec] = None
 
+        # (sub-app name or None for root, command name) → CommandSpec,
+        # built on first lookup for the current app_spec
+        self._command_index: dict[tuple[Optional[str], str], CommandSpec] = {}
+        self._command_index_spec: Optional[AppSpec] = None
+
         # Hold object for accessing GUI internals
         from .hold import Hold
         self.hold = Hold(self)
@@ -555,56 +637,19 @@ class Typer2Ui:
             >>>     ui("This command has a custom CLI name")
         """
         def decorator(func: Callable) -> Callable:
-            import asyncio
-            import inspect
-
-            # Handle view flag - overrides auto, header, and auto_scroll
-            final_auto = auto
-            final_header = header
-            final_auto_scroll = auto_scroll
-
-            if view:
-                final_auto = True
-                final_header = False
-                final_auto_scroll = False
-
-            # Store GUI options on the function
-            setattr(
+            target_func = _prepare_command(
                 func,
-                _GUI_OPTIONS_ATTR,
-                CommandUiSpec(
-                    button=button,
-                    threaded=threaded,
-                    auto=final_auto,
-                    header=final_header,
-                    submit_name=submit_name,
-                    on_select=on_select,
-                    auto_scroll=final_auto_scroll,
-                    modal=modal,
-                ),
+                button=button,
+                threaded=threaded,
+                auto=auto,
+                header=header,
+                submit_name=submit_name,
+                on_select=on_select,
+                auto_scroll=auto_scroll,
+                view=view,
+                modal=modal,
             )
 
-            # Handle async functions
-            if inspect.iscoroutinefunction(func):
-                def sync_wrapper(*args, **kwargs):
-                    return asyncio.run(func(*args, **kwargs))
-
-                # Copy over the GUI options to the wrapper
-                setattr(sync_wrapper, _GUI_OPTIONS_ATTR, getattr(func, _GUI_OPTIONS_ATTR))
-
-                # Store reference to original async function
-                setattr(sync_wrapper, '_original_async_func', func)
-
-                # Copy function metadata
-                sync_wrapper.__name__ = func.__name__
-                sync_wrapper.__doc__ = func.__doc__
-                sync_wrapper.__annotations__ = func.__annotations__
-                sync_wrapper.__signature__ = inspect.signature(func)
-
-                target_func = sync_wrapper
-            else:
-                target_func = func
-
             # Register with Typer
             self._typer_app.command(name=name, help=help)(target_func)
 
@@ -645,56 +690,19 @@ class Typer2Ui:
         """
 
         def decorator(func: Callable) -> Callable:
-            import asyncio
-            import inspect
-
-            # Handle view flag - overrides auto, header, and auto_scroll
-            final_auto = auto
-            final_header = header
-            final_auto_scroll = auto_scroll
-
-            if view:
-                final_auto = True
-                final_header = False
-                final_auto_scroll = False
-
-            # Store GUI options on the function
-            setattr(
+            return _prepare_command(
                 func,
-                _GUI_OPTIONS_ATTR,
-                CommandUiSpec(
-                    button=button,
-                    threaded=threaded,
-                    auto=final_auto,
-                    header=final_header,
-                    submit_name=submit_name,
-                    on_select=on_select,
-                    auto_scroll=final_auto_scroll,
-                    modal=modal,
-                ),
+                button=button,
+                threaded=threaded,
+                auto=auto,
+                header=header,
+                submit_name=submit_name,
+                on_select=on_select,
+                auto_scroll=auto_scroll,
+                view=view,
+                modal=modal,
             )
 
-            # If the function is async, wrap it for Typer compatibility
-            if inspect.iscoroutinefunction(func):
-                def sync_wrapper(*args, **kwargs):
-                    return asyncio.run(func(*args, **kwargs))
-
-                # Copy over the GUI options to the wrapper
-                setattr(sync_wrapper, _GUI_OPTIONS_ATTR, getattr(func, _GUI_OPTIONS_ATTR))
-
-                # Store reference to original async function
-                setattr(sync_wrapper, '_original_async_func', func)
-
-                # Copy function metadata
-                sync_wrapper.__name__ = func.__name__
-                sync_wrapper.__doc__ = func.__doc__
-                sync_wrapper.__annotations__ = func.__annotations__
-                sync_wrapper.__signature__ = inspect.signature(func)
-
-                return sync_wrapper
-
-            return func
-
         return decorator
 
     def get_command(self, name: Optional[str] = None):
@@ -759,17 +767,13 @@ class Typer2Ui:
         if not self.app_spec:
             return None
 
+        index = self._get_command_index()
+
         # Check if qualified name (e.g., "users:create")
         if ":" in command_name:
             tab_name, cmd_name = command_name.split(":", 1)
-
             # Search in specified sub-app
-            for sub_app in self.app_spec.sub_apps:
-                if sub_app.name == tab_name:
-                    for cmd in sub_app.commands:
-                        if cmd.name == cmd_name:
-                            return cmd
-            return None
+            return index.get((tab_name, cmd_name))
 
         # Unqualified name - determine context from runner
         current_tab = None
@@ -778,18 +782,37 @@ class Typer2Ui:
 
         # Search in current tab/sub-app if applicable
         if current_tab is not None:
-            for sub_app in self.app_spec.sub_apps:
-                if sub_app.name == current_tab:
-                    for cmd in sub_app.commands:
-                        if cmd.name == command_name:
-                            return cmd
+            command_spec = index.get((current_tab, command_name))
+            if command_spec:
+                return command_spec
 
         # Fallback: search in root commands
-        for cmd in self.app_spec.commands:
-            if cmd.name == command_name:
-                return cmd
+        return index.get((None, command_name))
 
-        return None
+    def _get_command_index(self) -> dict[tuple[Optional[str], str], CommandSpec]:
+        """Get the command lookup table for the current app_spec.
+
+        The table is built once per app_spec, so repeated get_command() calls
+        (e.g. from button handlers) are dict lookups instead of list scans.
+        Specs are frozen, so a spec's commands cannot change after the first
+        lookup; assigning a new app_spec (with added commands) rebuilds it.
+
+        Returns:
+            Dict mapping (sub-app name or None for root, command name) to spec
+            (empty when there is no app_spec yet)
+        """
+        if self.app_spec is None:
+            return {}
+        if self._command_index_spec is not self.app_spec:
+            index: dict[tuple[Optional[str], str], CommandSpec] = {}
+            for cmd in self.app_spec.commands:
+                index.setdefault((None, cmd.name), cmd)
+            for sub_app in self.app_spec.sub_apps:
+                for cmd in sub_app.commands:
+                    index.setdefault((sub_app.name, cmd.name), cmd)
+            self._command_index = index
+            self._command_index_spec = self.app_spec
+        return self._command_index
 
     @property
     def commands(self):
@@ -868,6 +891,10 @@ class Typer2Ui:
 
     def _run_gui(self):
         """Internal method to launch the GUI."""
+        # Flet is only needed for the GUI, so CLI runs don't pay for importing it
+        import flet as ft
+        from .runners.gui_runner import create_flet_app
+
         # Build the GUI model from the Typer app
         self.app_spec = build_app_spec(
             self._typer_app,
@@ -11,6 +11,8 @@ from .base import (
     get_current_runner,
     set_current_runner,
     to_component,
+    fingerprint_of,
+    fingerprints_of,
 )
 
 # Simple components
@@ -39,6 +41,8 @@ __all__ = [
     "get_current_runner",
     "set_current_runner",
     "to_component",
+    "fingerprint_of",
+    "fingerprints_of",
     # Simple
     "Text",
     "Md",
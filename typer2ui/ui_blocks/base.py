@@ -1,7 +1,7 @@
 """Base classes and utilities for UI blocks."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Hashable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import flet as ft
@@ -56,12 +56,53 @@ def to_component(value: Any) -> 'UiBlock':
     return Text(str(value))
 
 
+def fingerprint_of(value: Any) -> Optional[Hashable]:
+    """Get a hashable snapshot of what a ui() value renders.
+
+    Two values with equal fingerprints render identically, which lets
+    re-renders skip rebuilding unchanged output.
+
+    Args:
+        value: Value passed to ui() (string, plain value, or UiBlock)
+
+    Returns:
+        Hashable fingerprint, or None if the value cannot be compared
+        (callables, interactive blocks)
+    """
+    if isinstance(value, UiBlock):
+        return value.fingerprint()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return (type(value), value)
+    return None
+
+
+def fingerprints_of(values: Any) -> Optional[tuple]:
+    """Get a fingerprint for a sequence of ui() values.
+
+    Args:
+        values: Iterable of values
+
+    Returns:
+        Tuple of fingerprints, or None if any value cannot be compared
+    """
+    fingerprints = []
+    for value in values:
+        fingerprint = fingerprint_of(value)
+        if fingerprint is None:
+            return None
+        fingerprints.append(fingerprint)
+    return tuple(fingerprints)
+
+
 class UiBlock(ABC):
     """Base class for all UI components.
 
     Each component contains all presentation logic for every channel in a single class.
     """
 
+    # Slotted so that simple leaf blocks can drop their per-instance __dict__
+    __slots__ = ("_parent", "_children", "_ctx", "_flet_control")
+
     def __init__(self):
         """Initialize the UI block with hierarchy support."""
         # Parent-child hierarchy (for new architecture)
@@ -135,6 +176,17 @@ class UiBlock(ABC):
         """Whether this component should only appear in GUI mode."""
         return False
 
+    def fingerprint(self) -> Optional[Hashable]:
+        """Get a hashable snapshot of what this component renders.
+
+        Components with equal fingerprints render identically. The default
+        None means the component cannot be compared and is always rebuilt.
+
+        Returns:
+            Hashable fingerprint, or None
+        """
+        return None
+
     # Hierarchy management methods (for new architecture)
     @property
     def parent(self) -> Optional["UiBlock"]:
@@ -241,14 +241,14 @@ class DataTable(Container):
         # Create pagination buttons
         prev_button = ft.IconButton(
             icon=ft.Icons.ARROW_BACK,
-            on_click=lambda e: self.prev_page(),
+            on_click=self.prev_page,
             disabled=(self._current_page == 0),
             tooltip="Previous page",
         )
 
         next_button = ft.IconButton(
             icon=ft.Icons.ARROW_FORWARD,
-            on_click=lambda e: self.next_page(),
+            on_click=self.next_page,
             disabled=(self._current_page >= total_pages - 1),
             tooltip="Next page",
         )
@@ -1,11 +1,68 @@
 """Interactive components - Button, Link, TextInput, Alert, Confirm."""
 
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, Union
+from functools import partial
+from typing import Any, Callable, Iterator, Optional, Union
 
 from .base import UiBlock, get_current_runner, set_current_runner
 
 
+def _run_click_action(
+    block: Union["Button", "Link"], ctx, e: Any = None
+) -> Iterator[None]:
+    """Run a Button or Link callback and display any ui() output it produces.
+
+    Bound to each control with functools.partial, so building a button does
+    not create a new handler closure. Flet runs generator handlers on its
+    event loop and sends pending control updates at each ``yield``, so the
+    clicked control is disabled and shown as such before the callback runs,
+    then re-enabled when it finishes. Clicks arriving in the meantime are
+    ignored, so a quick double click runs the action only once.
+
+    Args:
+        block: Button or Link whose on_click is executed
+        ctx: GUI runner context the block was built with
+        e: Flet click event
+
+    Yields:
+        Once, after disabling the clicked control
+    """
+    if block._running:
+        return
+    block._running = True
+
+    clicked = getattr(e, "control", None)
+    try:
+        if clicked is not None:
+            clicked.disabled = True
+            # Let Flet send the disabled state before the callback blocks
+            yield
+
+        # Set runner context for callback execution
+        saved_runner = get_current_runner()
+        # Try to get runner from ctx if available
+        runner = getattr(ctx, "runner", None)
+        if runner:
+            set_current_runner(runner)
+        try:
+            # Create UI stack context for callback
+            with ctx.new_ui_stack() as callback_stack:
+                block.on_click()
+                # Display any ui() output from callback, with one page refresh
+                if runner and callback_stack:
+                    for item in callback_stack:
+                        control = ctx.build_child(block, item)
+                        runner.add_to_output(control, update=False)
+                    runner._safe_page_update()
+        finally:
+            set_current_runner(saved_runner)
+    finally:
+        block._running = False
+        # Flet sends this with the rest of the event's updates
+        if clicked is not None:
+            clicked.disabled = False
+
+
 @dataclass
 class Button(UiBlock):
     """Interactive button that executes an action (GUI only)."""
@@ -17,6 +74,8 @@ class Button(UiBlock):
     def __post_init__(self):
         """Initialize parent class after dataclass fields."""
         UiBlock.__init__(self)
+        # Set while on_click runs, to ignore repeated clicks
+        self._running = False
 
     def is_gui_only(self) -> bool:
         return True
@@ -55,28 +114,10 @@ class Button(UiBlock):
         if self.icon:
             icon_obj = getattr(ft.Icons, self.icon.upper(), None)
 
-        def handle_click(e):
-            # Set runner context for callback execution
-            saved_runner = get_current_runner()
-            # Try to get runner from ctx if available
-            runner = getattr(ctx, "runner", None)
-            if runner:
-                set_current_runner(runner)
-            try:
-                # Create UI stack context for callback
-                with ctx.new_ui_stack() as callback_stack:
-                    self.on_click()
-                    # Display any ui() output from callback
-                    for item in callback_stack:
-                        control = ctx.build_child(self, item)
-                        runner.add_to_output(control)
-            finally:
-                set_current_runner(saved_runner)
-
         return ft.ElevatedButton(
             self.text,
             icon=icon_obj,
-            on_click=handle_click,
+            on_click=partial(_run_click_action, self, ctx),
         )
 
 
@@ -90,6 +131,8 @@ class Link(UiBlock):
     def __post_init__(self):
         """Initialize parent class after dataclass fields."""
         UiBlock.__init__(self)
+        # Set while on_click runs, to ignore repeated clicks
+        self._running = False
 
     def is_gui_only(self) -> bool:
         return True
@@ -123,27 +166,10 @@ class Link(UiBlock):
         """
         import flet as ft
 
-        def handle_click(e):
-            # Set runner context for callback execution
-            saved_runner = get_current_runner()
-            runner = getattr(ctx, "runner", None)
-            if runner:
-                set_current_runner(runner)
-            try:
-                # Create UI stack context for callback
-                with ctx.new_ui_stack() as callback_stack:
-                    self.on_click()
-                    # Display any ui() output from callback
-                    for item in callback_stack:
-                        control = ctx.build_child(self, item)
-                        runner.add_to_output(control)
-            finally:
-                set_current_runner(saved_runner)
-
         return ft.TextButton(
             self.text,
             icon=ft.Icons.LINK,
-            on_click=handle_click,
+            on_click=partial(_run_click_action, self, ctx),
         )
 
 
@@ -1,9 +1,9 @@
 """Layout components - Row and Column for arranging components."""
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Hashable, Optional
 
-from .base import Container, UiBlock
+from .base import Container, UiBlock, fingerprints_of
 
 
 @dataclass
@@ -32,6 +32,10 @@ class Row(Container):
         self.children.append(child)
         self._update()
 
+    def fingerprint(self) -> Optional[Hashable]:
+        children = fingerprints_of(self.children)
+        return None if children is None else (type(self), children)
+
     def to_dict(self) -> dict:
         return {
             "type": "row",
@@ -106,6 +110,10 @@ class Column(Container):
         self.children.append(child)
         self._update()
 
+    def fingerprint(self) -> Optional[Hashable]:
+        children = fingerprints_of(self.children)
+        return None if children is None else (type(self), children)
+
     def to_dict(self) -> dict:
         return {
             "type": "column",
@@ -1,25 +1,56 @@
 """Markdown component - Display markdown content."""
 
+import functools
+import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Hashable, TYPE_CHECKING
 
 from .base import UiBlock
 
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cli_markdown(content: str) -> "Markdown":
+    """Parse markdown into a Rich Markdown renderable, cached by content.
+
+    Rich parses markdown on construction and rendering does not modify the
+    parsed tokens, so one renderable can be shared by every Md with the
+    same content. Use _parse_cli_markdown.cache_clear() to invalidate.
+
+    Args:
+        content: Markdown source
+
+    Returns:
+        Rich Markdown renderable
+    """
+    from rich.markdown import Markdown
+
+    return Markdown(content)
+
 
 @dataclass
 class Md(UiBlock):
     """Display Markdown content."""
 
+    __slots__ = ("content",)
+
     content: str
 
     def __post_init__(self):
         """Initialize parent class after dataclass fields."""
         UiBlock.__init__(self)
 
+    def fingerprint(self) -> Hashable:
+        return (type(self), self.content)
+
     def to_dict(self) -> dict:
         return {"type": "markdown", "content": self.content}
 
-    def build_cli(self, ctx) -> Any:
+    def build_cli(self, ctx) -> "Markdown":
         """Build Markdown for CLI (returns Rich Markdown).
 
         Args:
@@ -28,9 +59,7 @@ class Md(UiBlock):
         Returns:
             Rich Markdown renderable
         """
-        from rich.markdown import Markdown
-
-        return Markdown(self.content)
+        return _parse_cli_markdown(self.content)
 
     def build_gui(self, ctx) -> Any:
         """Build Markdown for GUI (returns Flet Markdown).
@@ -47,5 +76,5 @@ class Md(UiBlock):
             self.content,
             selectable=True,
             extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
-            on_tap_link=lambda e: print(f"Link tapped: {e.data}"),
+            on_tap_link=lambda e: logger.debug("Link tapped: %s", e.data),
         )
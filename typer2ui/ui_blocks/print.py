@@ -1,7 +1,7 @@
 """Print component - Handles print() output with automatic accumulation."""
 
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Hashable, Optional
 
 from .base import UiBlock
 
@@ -16,12 +16,17 @@ class Print(UiBlock):
     as before but encapsulated in a UI block.
     """
 
+    __slots__ = ("content",)
+
     content: str
 
     def __post_init__(self):
         """Initialize parent class after dataclass fields."""
         UiBlock.__init__(self)
 
+    def fingerprint(self) -> Hashable:
+        return (type(self), self.content)
+
     def to_dict(self) -> dict:
         return {"type": "print", "content": self.content}
 
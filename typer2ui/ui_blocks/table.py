@@ -1,34 +1,144 @@
 """Table component - Display tabular data."""
 
 from dataclasses import dataclass, field
-from typing import Any, Optional, Union, TYPE_CHECKING
+from itertools import zip_longest
+from sys import intern
+from typing import Any, Hashable, Iterable, Optional, Union, TYPE_CHECKING
 
-from .base import Container, UiBlock
+from .base import Container, UiBlock, fingerprints_of
 
 if TYPE_CHECKING:
     import flet as ft
     from .layout import Row
 
+# Minimum CLI column width for tables rendered before any rows arrive
+_CLI_MIN_STREAM_WIDTH = 12
+
+# Columns plus their padding and borders in a CLI table: 3 cells per column
+# (padding on both sides, one border) and the closing right border
+_CLI_COLUMN_OVERHEAD = 3
+
+
+def _fit_cli_widths(widths: list[int], console_width: int) -> list[int]:
+    """Cap CLI column widths so the bordered table fits the console.
+
+    The widest columns are capped at a shared limit; narrower columns keep
+    their width.
+
+    Args:
+        widths: Column content widths
+        console_width: Console width in cells
+
+    Returns:
+        Column widths that fit
+    """
+    available = console_width - _CLI_COLUMN_OVERHEAD * len(widths) - 1
+    if sum(widths) <= available:
+        return widths
+    remaining, count = available, len(widths)
+    for width in sorted(widths):
+        limit = remaining // count
+        if width > limit:
+            break
+        remaining -= width
+        count -= 1
+    return [min(width, max(limit, 1)) for width in widths]
+
+
+class _CliLines:
+    """Rich renderable that prints a table with edge lines left off.
+
+    Args:
+        renderable: Rich renderable (a table)
+        skip_top: Lines to leave off at the top
+        skip_bottom: Lines to leave off at the bottom
+    """
+
+    def __init__(self, renderable: Any, skip_top: int = 0, skip_bottom: int = 0):
+        self.renderable = renderable
+        self.skip_top = skip_top
+        self.skip_bottom = skip_bottom
+
+    def __rich_console__(self, console, options):
+        from rich.segment import Segment
+
+        lines = console.render_lines(self.renderable, options, pad=False)
+        for line in lines[self.skip_top : len(lines) - self.skip_bottom]:
+            yield from line
+            yield Segment.line()
+
+
+# Row count above which GUI tables are virtualized by default
+_GUI_VIRTUAL_THRESHOLD = 200
+
+# Rows materialized per window in a virtualized GUI table
+_GUI_WINDOW_ROWS = 100
+
 
 @dataclass
 class Table(Container):
     """Display tabular data.
 
-    Supports progressive row addition via context manager.
+    Supports progressive row addition via context manager. In the CLI, rows
+    added after the table was printed are streamed below it one by one,
+    without box edges and using column widths frozen at the first render.
+
+    In the GUI, a virtual table only builds controls for its first window of
+    rows; further windows are built when the user asks for more, so large
+    tables cost no more than the rows actually shown.
+
+    Args:
+        cols: Column headers
+        data: Rows of cell values or UiBlocks
+        title: Optional table title
+        virtual: Build GUI rows window by window. Defaults to True when the
+            table has more than 200 rows at first render.
     """
 
     cols: list[str]
     data: list[list[Any]] = field(default_factory=list)
     title: Optional[str] = None
+    virtual: Optional[bool] = None
 
     def __post_init__(self):
         """Initialize Container attributes after dataclass init."""
         super().__init__()
+        # Headers repeat across every render of a command; share one object
+        self.cols = [intern(col) if type(col) is str else col for col in self.cols]
         self.flet_control: Optional["ft.DataTable"] = None
+        # CLI column widths from the first render, and whether the printed
+        # table still lacks its bottom edge
+        self._cli_widths: Optional[list[int]] = None
+        self._cli_open = False
+        # Number of GUI rows allowed to be built (None = all of them)
+        self._gui_row_limit: Optional[int] = None
+        self._gui_more_button: Optional["ft.TextButton"] = None
 
     def add_row(self, row: Union[list[Any], "Row"]) -> None:
         """Add a row to the table.
 
+        Args:
+            row: List of cell values or Row component
+        """
+        self._append_row(row)
+        self._stream_cli_rows(self.data[-1:])
+        self._update()
+
+    def add_rows(self, rows: Iterable[Union[list[Any], "Row"]]) -> None:
+        """Add several rows to the table with a single display update.
+
+        Args:
+            rows: Iterable of rows (lists of cell values or Row components)
+        """
+        start = len(self.data)
+        for row in rows:
+            self._append_row(row)
+        self._stream_cli_rows(self.data[start:])
+        self._update()
+
+    def _append_row(self, row: Union[list[Any], "Row"]) -> None:
+        """Append a row to the data and the GUI control, without updating the display.
+
         Args:
             row: List of cell values or Row component
         """
@@ -44,21 +154,13 @@ class Table(Container):
 
         # New architecture: if ctx and flet_control exist, add row progressively
         if self._ctx and self._flet_control:
-            import flet as ft
-
-            # Build cells using ctx.build_child for new architecture
-            cells = []
-            for cell in row_data:
-                if isinstance(cell, UiBlock):
-                    cell_control = self._ctx.build_child(self, cell)
-                else:
-                    cell_control = ft.Text(str(cell))
-                cells.append(ft.DataCell(cell_control))
-
-            # Append to existing table
-            self._flet_control.rows.append(ft.DataRow(cells=cells))
-
-        self._update()
+            rows = self._flet_control.rows
+            # Rows beyond the current window are built by "show more"
+            if len(rows) == len(self.data) - 1 and (
+                self._gui_row_limit is None or len(rows) < self._gui_row_limit
+            ):
+                rows.append(self._gui_row(self._ctx, row_data))
+            self._sync_more_button()
 
     def update_cell(self, row_index: int, col_index: int, value: Any) -> None:
         """Update a cell value and trigger display update.
@@ -72,8 +174,24 @@ class Table(Container):
             self.data[row_index]
         ):
             self.data[row_index][col_index] = value
+            # Rebuild only the changed cell's control; other cells are kept
+            if self._ctx and self._flet_control and row_index < len(
+                self._flet_control.rows
+            ):
+                cells = self._flet_control.rows[row_index].cells
+                if col_index < len(cells):
+                    cells[col_index].content = self._gui_cell(self._ctx, value)
             self._update()
 
+    def fingerprint(self) -> Optional[Hashable]:
+        rows = []
+        for row in self.data:
+            row_fingerprint = fingerprints_of(row)
+            if row_fingerprint is None:
+                return None
+            rows.append(row_fingerprint)
+        return (type(self), tuple(self.cols), self.title, self.virtual, tuple(rows))
+
     def to_dict(self) -> dict:
         return {
             "type": "table",
@@ -85,36 +203,147 @@ class Table(Container):
     def build_cli(self, ctx) -> Any:
         """Build Table for CLI (returns Rich Table).
 
+        A table that streams rows (one without rows yet, or one rendered
+        inside its own ``with`` block) is drawn open at the bottom, with
+        column widths frozen to fit the console, so rows added later line up
+        directly below it. Other tables are auto-sized.
+
         Args:
             ctx: CLI runner context
 
+        Returns:
+            Rich renderable
+        """
+        from rich.cells import cell_len
+
+        rows = [self._cli_cells(ctx, row) for row in self.data]
+
+        # Column widths from the header and the rows, scanning one column at
+        # a time; kept so rows streamed later can line up
+        widths = [cell_len(col) for col in self.cols]
+        columns = zip_longest(*rows, fillvalue="")
+        for i, column in zip(range(len(widths)), columns):
+            widths[i] = max(widths[i], *map(cell_len, column))
+
+        streaming = not rows or self._context_active
+        if streaming:
+            widths = [max(w, _CLI_MIN_STREAM_WIDTH) for w in widths]
+        console = getattr(ctx, "console", None)
+        if console is not None:
+            widths = _fit_cli_widths(widths, console.width)
+        self._cli_widths = widths
+
+        table = self._new_cli_table(widths if streaming else None, show_header=True)
+        for cells in rows:
+            table.add_row(*cells)
+
+        self._cli_open = streaming
+        if streaming:
+            # Leave the bottom edge off; rows are printed below as they arrive
+            return _CliLines(table, skip_bottom=1)
+        return table
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[Any],
+    ) -> bool:
+        """Exit context manager - close a table left open in the CLI."""
+        self._close_cli_table()
+        return super().__exit__(exc_type, exc_val, exc_tb)
+
+    def _new_cli_table(self, widths: Optional[list[int]], show_header: bool) -> Any:
+        """Create an empty Rich table with this table's columns.
+
+        Args:
+            widths: Frozen column widths (cells wider than their column wrap),
+                or None to auto-size the columns
+            show_header: Whether to render the title and column headers
+
         Returns:
             Rich Table renderable
         """
         from rich.table import Table as RichTable
 
         table = RichTable(
-            show_header=True, header_style="bold magenta", title=self.title
+            show_header=show_header,
+            header_style="bold magenta",
+            title=self.title if show_header else None,
         )
+        if widths is None:
+            for col in self.cols:
+                table.add_column(col, style="cyan")
+        else:
+            for col, width in zip(self.cols, widths):
+                table.add_column(col, style="cyan", width=width, overflow="fold")
+        return table
 
-        # Add columns
-        for col in self.cols:
-            table.add_column(col, style="cyan")
+    def _cli_cells(self, ctx, row: list[Any]) -> list[str]:
+        """Convert a row's cells to strings for a Rich table.
 
-        # Add rows - convert cells to strings
-        for row in self.data:
-            cells = []
-            for cell in row:
-                if isinstance(cell, UiBlock):
-                    # Use build_cli for UiBlock cells
-                    renderable = ctx.build_child(self, cell)
-                    # Convert to string for table cell
-                    cells.append(str(renderable))
-                else:
-                    cells.append(str(cell))
-            table.add_row(*cells)
+        Args:
+            ctx: CLI runner context
+            row: Row of cell values or UiBlocks
 
-        return table
+        Returns:
+            Cell strings
+        """
+        cells = []
+        for cell in row:
+            if isinstance(cell, UiBlock):
+                # Use build_cli for UiBlock cells
+                renderable = ctx.build_child(self, cell)
+                # Convert to string for table cell
+                cells.append(str(renderable))
+            else:
+                cells.append(str(cell))
+        return cells
+
+    def _stream_cli_rows(self, rows: list[list[Any]]) -> None:
+        """Print rows added after the table was rendered in the CLI.
+
+        Only the new rows are formatted, with the column widths frozen at the
+        first render, so the already printed part is never re-rendered.
+
+        Args:
+            rows: Newly added rows
+        """
+        console = self._cli_console()
+        widths = self._cli_widths
+        if not rows or widths is None or console is None:
+            return
+
+        table = self._new_cli_table(widths, show_header=False)
+        for row in rows:
+            table.add_row(*self._cli_cells(self._ctx, row))
+        # Only the side edges; the bottom edge is drawn when the table closes
+        console.print(_CliLines(table, skip_top=1, skip_bottom=1))
+        self._cli_open = True
+
+    def _close_cli_table(self) -> None:
+        """Print the bottom edge of a table left open by streamed CLI rows."""
+        console = self._cli_console()
+        if not self._cli_open or self._cli_widths is None or console is None:
+            return
+
+        from rich import box
+
+        # Same box and cell padding as the Rich table (HEAVY_HEAD, 1 + 1)
+        bottom = box.HEAVY_HEAD.get_bottom([w + 2 for w in self._cli_widths])
+        console.print(bottom, markup=False, highlight=False)
+        self._cli_open = False
+
+    def _cli_console(self) -> Any:
+        """Return the console of the CLI context this table was rendered in.
+
+        Returns:
+            Rich Console, or None outside the CLI
+        """
+        ctx = self._ctx
+        if hasattr(ctx, "page"):
+            return None
+        return getattr(ctx, "console", None)
 
     def build_gui(self, ctx) -> Any:
         """Build Table for GUI (returns Flet DataTable).
@@ -123,25 +352,23 @@ class Table(Container):
             ctx: GUI runner context
 
         Returns:
-            Flet DataTable control (or Column if title is present)
+            Flet DataTable control (or Column if a title or virtual paging
+            controls are present)
         """
         import flet as ft
 
+        virtual = self.virtual
+        if virtual is None:
+            virtual = len(self.data) > _GUI_VIRTUAL_THRESHOLD
+        self._gui_row_limit = _GUI_WINDOW_ROWS if virtual else None
+
         columns = [
             ft.DataColumn(ft.Text(header, weight=ft.FontWeight.BOLD))
             for header in self.cols
         ]
 
-        # Build cells - can be UIBlocks or plain values
-        def cell_to_control(cell):
-            if isinstance(cell, UiBlock):
-                return ctx.build_child(self, cell)
-            else:
-                return ft.Text(str(cell))
-
         data_rows = [
-            ft.DataRow(cells=[ft.DataCell(cell_to_control(cell)) for cell in row])
-            for row in self.data
+            self._gui_row(ctx, row) for row in self.data[: self._gui_row_limit]
         ]
 
         self._flet_control = ft.DataTable(
@@ -152,13 +379,78 @@ class Table(Container):
             horizontal_lines=ft.BorderSide(1, ft.Colors.GREY_300),
         )
 
+        controls: list[ft.Control] = [self._flet_control]
         if self.title:
             # If there's a title, wrap the table in a Column
-            return ft.Column(
-                [
-                    ft.Text(self.title, size=16, weight=ft.FontWeight.BOLD),
-                    self._flet_control,
-                ]
-            )
-        else:
+            controls.insert(0, ft.Text(self.title, size=16, weight=ft.FontWeight.BOLD))
+
+        self._gui_more_button = None
+        if virtual:
+            self._gui_more_button = ft.TextButton(on_click=self._show_more_rows)
+            self._sync_more_button()
+            controls.append(self._gui_more_button)
+
+        if len(controls) == 1:
             return self._flet_control
+        return ft.Column(controls)
+
+    def _gui_row(self, ctx, row: list[Any]) -> Any:
+        """Build a Flet DataRow for a row of cells.
+
+        Args:
+            ctx: GUI runner context
+            row: Row of cell values or UiBlocks
+
+        Returns:
+            Flet DataRow control
+        """
+        import flet as ft
+
+        return ft.DataRow(
+            cells=[ft.DataCell(self._gui_cell(ctx, cell)) for cell in row]
+        )
+
+    def _gui_cell(self, ctx, cell: Any) -> Any:
+        """Build the Flet control shown inside a table cell.
+
+        Args:
+            ctx: GUI runner context
+            cell: Cell value or UiBlock
+
+        Returns:
+            Flet control
+        """
+        import flet as ft
+
+        # Cells can be UIBlocks or plain values
+        if isinstance(cell, UiBlock):
+            return ctx.build_child(self, cell)
+        return ft.Text(str(cell))
+
+    def _show_more_rows(self) -> None:
+        """Build the next window of rows of a virtual GUI table.
+
+        Used directly as the "show more" click handler (Flet calls it without
+        the event).
+        """
+        ctx = self._ctx
+        if ctx is None or self._flet_control is None:
+            return
+        rows = self._flet_control.rows
+        self._gui_row_limit = len(rows) + _GUI_WINDOW_ROWS
+        rows.extend(
+            self._gui_row(ctx, row)
+            for row in self.data[len(rows) : self._gui_row_limit]
+        )
+        self._sync_more_button()
+        self._update()
+
+    def _sync_more_button(self) -> None:
+        """Update the "show more" button of a virtual GUI table."""
+        if self._gui_more_button is None or self._flet_control is None:
+            return
+        hidden = len(self.data) - len(self._flet_control.rows)
+        self._gui_more_button.content = (
+            f"Show {min(hidden, _GUI_WINDOW_ROWS)} more rows ({hidden} not shown)"
+        )
+        self._gui_more_button.visible = hidden > 0
@@ -1,9 +1,15 @@
 """Tabs components - Tabbed interface."""
 
 from dataclasses import dataclass
-from typing import Any, Callable, Union
+from typing import Any, Callable, Hashable, Optional, Union
 
-from .base import UiBlock, to_component
+from .base import (
+    UiBlock,
+    fingerprint_of,
+    get_current_runner,
+    set_current_runner,
+    to_component,
+)
 
 
 @dataclass
@@ -15,6 +21,8 @@ class Tab:
         content: Either a UiBlock component, a callable that builds content using ui(), or a string (converted to markdown)
     """
 
+    __slots__ = ("label", "content")
+
     label: str
     content: Union[UiBlock, Callable, str, Any]
 
@@ -35,6 +43,8 @@ class Tabs(UiBlock):
         tabs: List of Tab objects
     """
 
+    __slots__ = ("tabs",)
+
     tabs: list[Tab]
 
     def __post_init__(self):
@@ -45,6 +55,18 @@ class Tabs(UiBlock):
         if not all(isinstance(tab, Tab) for tab in self.tabs):
             raise ValueError("All items must be Tab objects")
 
+    def fingerprint(self) -> Optional[Hashable]:
+        tabs = []
+        for tab in self.tabs:
+            # Callable content is only known once built
+            if callable(tab.content):
+                return None
+            content = fingerprint_of(tab.content)
+            if content is None:
+                return None
+            tabs.append((tab.label, content))
+        return (type(self), tuple(tabs))
+
     def to_dict(self) -> dict:
         return {
             "type": "tabs",
@@ -92,6 +114,9 @@ class Tabs(UiBlock):
     def build_gui(self, ctx) -> Any:
         """Build Tabs for GUI (returns Flet Tabs with TabBar + TabBarView).
 
+        Only the initially selected tab is built up front; every other tab's
+        content is built the first time that tab is selected and then kept.
+
         Args:
             ctx: GUI runner context
 
@@ -103,18 +128,37 @@ class Tabs(UiBlock):
         # Create tab labels (for TabBar)
         tab_controls = [ft.Tab(tab.label) for tab in self.tabs]
 
-        # Create tab content (for TabBarView)
-        content_controls = []
-        for tab in self.tabs:
-            # Use ctx.build_child to handle all content types (string/callable/UIBlock)
-            tab_content = ctx.build_child(self, tab.content)
+        # Create padded placeholders for tab content (for TabBarView)
+        content_controls = [ft.Container(padding=10) for _ in self.tabs]
+        built: set[int] = set()
 
-            # Wrap in Container for padding
-            wrapped_content = ft.Container(
-                content=tab_content,
-                padding=10,
+        def build_tab(index: int) -> None:
+            """Build the content of a tab once, on first use."""
+            if index in built:
+                return
+            built.add(index)
+            # Use ctx.build_child to handle all content types (string/callable/UIBlock)
+            content_controls[index].content = ctx.build_child(
+                self, self.tabs[index].content
             )
-            content_controls.append(wrapped_content)
+
+        def handle_change(e):
+            index = e.control.selected_index
+            if index in built:
+                return
+            # Set runner context for content builders calling ui()
+            saved_runner = get_current_runner()
+            runner = getattr(ctx, "runner", None)
+            if runner:
+                set_current_runner(runner)
+            try:
+                build_tab(index)
+            finally:
+                set_current_runner(saved_runner)
+            content_controls[index].update()
+
+        if self.tabs:
+            build_tab(0)
 
         # Create TabBar and TabBarView (Flet 0.80+ API)
         tab_bar = ft.TabBar(tabs=tab_controls)
@@ -130,4 +174,5 @@ class Tabs(UiBlock):
                 spacing=0,
             ),
             length=len(self.tabs),
+            on_change=handle_change,
         )
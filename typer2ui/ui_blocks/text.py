@@ -1,7 +1,7 @@
 """Text component - Display plain text."""
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Hashable
 
 from .base import UiBlock
 
@@ -10,12 +10,17 @@ from .base import UiBlock
 class Text(UiBlock):
     """Display plain text."""
 
+    __slots__ = ("content",)
+
     content: str
 
     def __post_init__(self):
         """Initialize parent class after dataclass fields."""
         UiBlock.__init__(self)
 
+    def fingerprint(self) -> Hashable:
+        return (type(self), self.content)
+
     def to_dict(self) -> dict:
         return {"type": "text", "content": self.content}
 